@@ -7,11 +7,30 @@ Loads settings from JSON templates and environment variables.
 import json
 import os
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Dict, Any
 
 from dotenv import load_dotenv
 
+try:
+    import orjson
+except ImportError:  # optional speedup, stdlib json is the fallback
+    orjson = None
+
+
+@lru_cache(maxsize=64)
+def _read_json(path: str, mtime_ns: int) -> Dict[str, Any]:
+    """
+    Parse a JSON file.
+
+    Cached on (path, mtime) so repeated loads in one process skip the
+    parse, while edits to the file are still picked up. Callers must not
+    mutate the returned dict.
+    """
+    data = Path(path).read_bytes()
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
 
 @dataclass
 class Config:
@@ -64,8 +83,8 @@ class Config:
     auto_ignore_pair_age_hours: int = None  # None means use filter default
     auto_ignore_market_cap_usd: float = None  # None means use filter default
 
-    # Legacy memes (from filter JSON)
-    legacy_memes: list = None
+    # Legacy memes (from filter JSON), frozen for O(1) lookups per LP event
+    legacy_memes: frozenset = None
 
     # Mode: LIVE or TEST
     mode: str = "TEST"
@@ -90,8 +109,7 @@ class Config:
         if not json_path.exists():
             raise FileNotFoundError(f"Config file not found: {json_path}")
 
-        with open(json_path, 'r') as f:
-            return json.load(f)
+        return _read_json(str(json_path), json_path.stat().st_mtime_ns)
 
     @classmethod
     def from_env(cls) -> "Config":
@@ -166,7 +184,7 @@ class Config:
             auto_ignore_pair_age_hours=auto_ignore.get("pair_age_hours_gt"),
             auto_ignore_market_cap_usd=auto_ignore.get("market_cap_usd_gt"),
 
-            legacy_memes=filter_data.get("legacy_memes", []),
+            legacy_memes=frozenset(filter_data.get("legacy_memes", [])),
 
             # Mode
             mode=os.getenv("MODE", "TEST").upper(),
@@ -2,6 +2,17 @@
 Utility functions for JournalTX.
 """
 
+import os
+import re
+import stat
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Tuple
+from urllib.parse import urlparse
+
+if TYPE_CHECKING:
+    import requests
+
 
 def format_age_human(hours: float) -> str:
     """
@@ -93,3 +104,108 @@ def format_pair_age(hours: float, short: bool = False) -> str:
         return f"{hours:.1f}h ({human})"
     else:
         return f"{hours:.0f}h ({human})"
+
+
+def mask_url(url: str) -> str:
+    """Mask sensitive parts of a URL for safe logging."""
+    if not url:
+        return "Not configured"
+
+    try:
+        if "quiknode" in url.lower() or "quicknode" in url.lower():
+            parts = url.split("/")
+            if len(parts) >= 4:
+                base = "/".join(parts[:3])
+                return f"{base}/***MASKED***/"
+
+        parsed = urlparse(url)
+        return f"{parsed.scheme}://{parsed.netloc}/***MASKED***"
+
+    except Exception:
+        return "***MASKED***"
+
+
+def write_text_atomic(path: Path, content: str) -> None:
+    """
+    Replace a file's contents atomically.
+
+    Writes to a temporary sibling, then renames it over the target, so a
+    crash mid-write never leaves a truncated file. The target's permission
+    bits are kept (.env files hold secrets).
+    """
+    path = Path(path)
+    tmp_path = path.with_name(path.name + ".tmp")
+
+    with open(tmp_path, "w") as f:
+        f.write(content)
+        f.flush()
+        os.fsync(f.fileno())
+
+    if path.exists():
+        os.chmod(tmp_path, stat.S_IMODE(path.stat().st_mode))
+
+    os.replace(tmp_path, path)
+
+
+@lru_cache(maxsize=8)
+def _env_keys_pattern(keys: Tuple[str, ...]) -> re.Pattern:
+    """Compile (once per key set) a regex matching whole `KEY=...` lines."""
+    return re.compile(r"^(" + "|".join(map(re.escape, keys)) + r")=.*$", re.M)
+
+
+def update_env_keys(path: Path, updates: Dict[str, str]) -> None:
+    """
+    Set keys in a .env file, leaving every other line untouched.
+
+    Existing `KEY=...` lines are rewritten in a single regex pass; keys not
+    yet in the file are appended. The file is replaced atomically.
+    """
+    path = Path(path)
+    seen = set()
+
+    def _replace(match: re.Match) -> str:
+        key = match.group(1)
+        seen.add(key)
+        return f"{key}={updates[key]}"
+
+    content = _env_keys_pattern(tuple(updates)).sub(_replace, path.read_text())
+
+    missing = [f"{key}={value}" for key, value in updates.items() if key not in seen]
+    if missing:
+        if content and not content.endswith("\n"):
+            content += "\n"
+        content += "\n".join(missing) + "\n"
+
+    write_text_atomic(path, content)
+
+
+def make_retrying_session() -> "requests.Session":
+    """
+    Build a pooled requests session for the setup scripts.
+
+    Back-to-back calls to the same host reuse the keep-alive connection
+    instead of a new TCP+TLS handshake each time, and transient failures
+    are retried with exponential backoff instead of failing the wizard step.
+
+    Only GETs are retried on rate limits, 5xx and read errors. A POST such
+    as sendMessage may already have been delivered when those come back,
+    so it is only retried when the connection could not be made at all.
+    """
+    # Imported here so the formatting helpers don't pull in requests
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=10,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=["GET"],
+            respect_retry_after_header=True,
+        ),
+    ))
+    return session
@@ -10,7 +10,7 @@ Key principles:
 
 import logging
 from datetime import datetime
-from typing import Optional, Tuple
+from typing import Collection, Optional, Tuple
 
 import requests
 
@@ -19,7 +19,7 @@ from journaltx.filters.signals import Signal, get_signal_tracker
 logger = logging.getLogger(__name__)
 
 
-def get_pair_market_data(pair: str, legacy_memes: list = None) -> Optional[dict]:
+def get_pair_market_data(pair: str, legacy_memes: Collection[str] = None) -> Optional[dict]:
     """
     Fetch market data from DexScreener.
 
@@ -100,7 +100,7 @@ def check_early_stage_opportunity(
     min_lp_ignite_sol: float = 300.0,
     max_market_cap_defensive: float = 20_000_000.0,
     signal_window_minutes: int = 30,
-    legacy_memes: list = None,
+    legacy_memes: Collection[str] = None,
     is_new_pool: bool = False,
     require_multi_signal: bool = True,
 ) -> Tuple[bool, bool, dict]:
@@ -134,11 +134,13 @@ def check_early_stage_opportunity(
         details["checks"].append({"rule": "Pair format", "status": "FAIL", "reason": "Invalid format"})
         return False, should_log, details
 
-    quote = pair.split("/")[1].upper()
-    if quote != "SOL":
-        logger.info(f"[EARLY] ❌ Rule 1 FAIL: Not SOL pair (quote={quote})")
-        details["checks"].append({"rule": "Pair type", "status": "FAIL", "reason": f"Not SOL pair ({quote})"})
-        return False, should_log, details
+    # Fast path for the canonical TOKEN/SOL form, split only otherwise
+    if not pair.endswith("/SOL") or pair.count("/") != 1:
+        quote = pair.split("/")[1].upper()
+        if quote != "SOL":
+            logger.info(f"[EARLY] ❌ Rule 1 FAIL: Not SOL pair (quote={quote})")
+            details["checks"].append({"rule": "Pair type", "status": "FAIL", "reason": f"Not SOL pair ({quote})"})
+            return False, should_log, details
 
     logger.info(f"[EARLY] ✓ Rule 1 PASS: Valid TOKEN/SOL pair")
     details["checks"].append({"rule": "Pair type", "status": "PASS", "reason": "TOKEN/SOL"})
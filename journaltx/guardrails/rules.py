@@ -70,7 +70,7 @@ def check_scale_out_usage(config: Config, trade_id: int) -> Optional[GuardrailWa
     from journaltx.core.db import session_scope
 
     with session_scope(config) as session:
-        trade = session.query(Trade).filter(Trade.id == trade_id).first()
+        trade = session.get(Trade, trade_id)
 
         if not trade:
             return None
@@ -8,6 +8,8 @@ import logging
 from datetime import datetime
 from typing import Any, Callable, Dict, Optional
 
+from sqlalchemy.orm import Session
+
 from journaltx.core.config import Config
 from journaltx.core.models import Alert, AlertType
 from journaltx.core.db import session_scope
@@ -19,6 +21,19 @@ from journaltx.filters.early_meme import check_early_stage_opportunity
 logger = logging.getLogger(__name__)
 
 
+def _persist_alert(session: Session, alert: Alert) -> None:
+    """
+    Insert an alert and detach it from the session.
+
+    Detaching before session_scope commits keeps the commit from expiring
+    it, so the alert stays readable by callbacks that send it after the
+    session has closed.
+    """
+    session.add(alert)
+    session.flush()
+    session.expunge(alert)
+
+
 class LPEventListener:
     """
     Listens for LP events from QuickNode WebSocket.
@@ -128,8 +143,7 @@ class LPEventListener:
                 mode=self.config.mode,
                 triggered_at=parsed_event.timestamp,
             )
-            session.add(alert)
-            session.flush()
+            _persist_alert(session, alert)
 
             logger.info(
                 f"Logged alert: {alert.pair} | "
@@ -236,8 +250,7 @@ class LPEventListener:
                 mode=self.config.mode,
                 triggered_at=event.timestamp,
             )
-            session.add(alert)
-            session.flush()
+            _persist_alert(session, alert)
 
             logger.info(f"Logged LP add alert: {event}")
 
@@ -307,8 +320,7 @@ class LPEventListener:
                 mode=self.config.mode,
                 triggered_at=event.timestamp,
             )
-            session.add(alert)
-            session.flush()
+            _persist_alert(session, alert)
 
             logger.info(f"Logged LP remove alert: {event}")
 
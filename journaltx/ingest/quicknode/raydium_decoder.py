@@ -16,6 +16,11 @@ from dataclasses import dataclass
 
 import requests
 
+try:
+    from based58 import b58decode
+except ImportError:  # optional speedup, the pure-Python base58 package is the fallback
+    from base58 import b58decode
+
 logger = logging.getLogger(__name__)
 
 # Raydium AMM V4 Program ID
@@ -24,8 +29,21 @@ RAYDIUM_AMM_V4 = "675kPX9MHTjS2zt1qfr1NYHuzeLXfQM9H24wFSUt1Mp8"
 # WSOL mint address
 WSOL_MINT = "So11111111111111111111111111111111111111112"
 
+LAMPORTS_PER_SOL = 1_000_000_000
+
 # Minimum SOL delta to consider as LP add (noise threshold: 0.1 SOL)
 MIN_SOL_DELTA_LAMPORTS = 100_000_000  # 0.1 SOL
+MIN_SOL_DELTA_SOL = MIN_SOL_DELTA_LAMPORTS / LAMPORTS_PER_SOL
+
+# Raydium AMM V4 instruction discriminators (first data byte),
+# based on Raydium AMM source code
+_DISCRIMINATOR_MAP = {
+    0: "initialize",
+    1: "initialize2",
+    3: "deposit",  # Add liquidity
+    4: "withdraw",  # Remove liquidity
+    9: "swap",
+}
 
 
 @dataclass
@@ -131,12 +149,11 @@ def decode_raydium_transaction(
             logger.info(f"[DECODE] ✓ LP tokens minted: {amounts['lp_minted']:,.4f}")
 
         # Apply noise threshold
-        min_sol_threshold = MIN_SOL_DELTA_LAMPORTS / 1_000_000_000
-        if amounts["sol_delta"] < min_sol_threshold:
-            logger.info(f"[DECODE] ❌ SOL delta below noise threshold ({amounts['sol_delta']:.4f} < {min_sol_threshold} SOL)")
+        if amounts["sol_delta"] < MIN_SOL_DELTA_SOL:
+            logger.info(f"[DECODE] ❌ SOL delta below noise threshold ({amounts['sol_delta']:.4f} < {MIN_SOL_DELTA_SOL} SOL)")
             return None
 
-        logger.info(f"[DECODE] ✓ Passed noise threshold ({amounts['sol_delta']:.4f} >= {min_sol_threshold} SOL)")
+        logger.info(f"[DECODE] ✓ Passed noise threshold ({amounts['sol_delta']:.4f} >= {MIN_SOL_DELTA_SOL} SOL)")
 
         # Get signature
         signature = signatures[0] if signatures else ""
@@ -220,8 +237,7 @@ def _decode_instruction_type(data: str) -> str:
     try:
         # Try base58 first (most common for Solana)
         try:
-            import base58
-            decoded = base58.b58decode(data)
+            decoded = b58decode(data.encode("ascii"))
         except:
             # Fallback to base64
             decoded = base64.b64decode(data)
@@ -229,24 +245,9 @@ def _decode_instruction_type(data: str) -> str:
         if len(decoded) < 1:
             return "unknown"
 
-        # Raydium AMM V4 instruction discriminators (first byte)
-        discriminator = decoded[0]
-
-        # Based on Raydium AMM source code
-        if discriminator == 0:
-            return "initialize"
-        elif discriminator == 1:
-            return "initialize2"
-        elif discriminator == 3:
-            return "deposit"  # Add liquidity
-        elif discriminator == 4:
-            return "withdraw"  # Remove liquidity
-        elif discriminator == 9:
-            return "swap"
-        else:
-            # Check if it might be an LP operation by looking at account count
-            # LP operations typically have more accounts than swaps
-            return "unknown_lp"
+        # Other discriminators might still be LP operations
+        # (LP operations typically have more accounts than swaps)
+        return _DISCRIMINATOR_MAP.get(decoded[0], "unknown_lp")
 
     except Exception as e:
         logger.debug(f"Could not decode instruction data: {e}")
@@ -409,10 +410,10 @@ def _calculate_balance_deltas(
 
             if delta > max_sol_increase:
                 max_sol_increase = delta
-                sol_before = pre / 1_000_000_000
-                sol_after = post / 1_000_000_000
+                sol_before = pre / LAMPORTS_PER_SOL
+                sol_after = post / LAMPORTS_PER_SOL
 
-        sol_delta = max_sol_increase / 1_000_000_000  # Convert to SOL
+        sol_delta = max_sol_increase / LAMPORTS_PER_SOL
 
         # RULE: SOL must INCREASE for LP add
         if sol_delta <= 0:
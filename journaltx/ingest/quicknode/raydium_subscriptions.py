@@ -7,7 +7,7 @@ liquidity pool additions in real-time.
 
 import json
 import logging
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -18,6 +18,13 @@ RAYDIUM_LIQUIDITY_POOL_V3 = "CAMMCzo5YL8w4VFF8KVHrK22GGUQpMpTFb5iJHJxgKWs"
 ORCA_SWAP_PROGRAM = "9W959DqEETiGZocYWCQPaJe6uQ6NKkqAkAF4UhyW5xrq"
 ORCA_WHIRPOOLS_PROGRAM = "whirLbMiicVdio4qvUfM5KAg6Ct8VwpYzGff3uctyCc"
 
+# Lowercase log patterns for liquidity additions
+# ("liquidity" also covers "add liquidity")
+LP_INDICATORS = ("initialize", "deposit", "create pool", "liquidity")
+
+# Lowercase log patterns for removals/swaps
+LP_EXCLUSIONS = ("withdraw", "remove", "swap")
+
 
 def get_raydium_subscription() -> Dict[str, Any]:
     """
@@ -84,23 +91,12 @@ def is_liquidity_addition(logs: list[str]) -> bool:
 
     logs_text = " ".join(logs).lower()
 
-    # Look for LP addition indicators
-    # These are common log patterns for liquidity additions
-    lp_indicators = [
-        "initialize",
-        "deposit",
-        "add liquidity",
-        "create pool",
-        "liquidity",
-    ]
-
     # Must have liquidity-related logs
-    has_liquidity = any(indicator in logs_text for indicator in lp_indicators)
+    if not any(indicator in logs_text for indicator in LP_INDICATORS):
+        return False
 
     # Exclude removals/swaps
-    is_removal = any(word in logs_text for word in ["withdraw", "remove", "swap"])
-
-    return has_liquidity and not is_removal
+    return not any(word in logs_text for word in LP_EXCLUSIONS)
 
 
 def extract_signature_from_notification(notification: Dict[str, Any]) -> Optional[str]:
@@ -153,3 +149,45 @@ def extract_signature_from_notification(notification: Dict[str, Any]) -> Optiona
     except Exception as e:
         logger.error(f"Error extracting signature: {e}")
         return None
+
+
+def parse_log_notification(data: Dict[str, Any]) -> Optional[Tuple[str, List[str]]]:
+    """
+    Pull the signature and logs out of a decoded logsNotification frame.
+
+    Pure dict/str work with no I/O or listener state, so it stays cheap
+    on the WebSocket hot path and can be compiled (e.g. with mypyc)
+    on its own.
+
+    Args:
+        data: Decoded WebSocket frame
+
+    Returns:
+        (signature, logs), or None for non-notification frames, failed
+        transactions, and notifications without logs or a signature
+    """
+    params = data.get("params")
+    if not params or "result" not in params:
+        return None
+
+    # QuickNode logsNotification has nested structure:
+    # result.value.logs and result.value.err and result.value.signature
+    result = params["result"]
+    value = result.get("value", result)  # Fallback to result if no value
+
+    # Ignore failed transactions (err != null)
+    if value.get("err") is not None:
+        logger.debug("[WS] ❌ Ignoring failed transaction: %s", value["err"])
+        return None
+
+    logs = value.get("logs")
+    if not logs:
+        return None
+
+    # Normally right on `value`; only walk the full notification if it isn't
+    signature = value.get("signature") or extract_signature_from_notification(data)
+    if not signature:
+        logger.debug("[WS] ❌ Could not extract signature from notification")
+        return None
+
+    return signature, logs
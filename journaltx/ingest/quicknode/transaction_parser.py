@@ -6,11 +6,13 @@ liquidity pool addition information including tokens and amounts.
 """
 
 import logging
-from typing import Dict, Any, Optional
+import time
+from typing import Dict, Any, List, Optional
 from dataclasses import dataclass
 from datetime import datetime
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from journaltx.ingest.quicknode.raydium_decoder import (
     decode_raydium_transaction,
@@ -80,6 +82,11 @@ class SolanaTransactionParser:
         """
         self.http_rpc_url = http_rpc_url
         self.session = requests.Session()
+        # Fetches run from worker threads - keep enough keep-alive
+        # connections that concurrent calls don't re-handshake TLS
+        self.session.mount("https://", HTTPAdapter(pool_maxsize=32))
+        # Cleared on the first rejected JSON-RPC batch, see get_transactions_batch
+        self.batch_supported = True
         self.token_resolver = get_token_resolver(http_rpc_url)
         self.price_service = get_price_service()
 
@@ -94,8 +101,6 @@ class SolanaTransactionParser:
         Returns:
             Transaction details or None
         """
-        import time
-
         for attempt in range(retries):
             try:
                 payload = {
@@ -149,6 +154,73 @@ class SolanaTransactionParser:
 
         return None
 
+    def get_transactions_batch(self, signatures: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Fetch several transactions in one JSON-RPC batch request.
+
+        Only signatures the batch resolved are returned - callers fetch
+        the rest with get_transaction. If the provider rejects batches
+        (non-list body or a 4xx other than 429), batching is switched off
+        for this parser and later calls return {} without a round-trip.
+
+        Args:
+            signatures: Transaction signatures
+
+        Returns:
+            Dict of signature -> transaction details, for batch hits only
+        """
+        if not self.batch_supported:
+            return {}
+
+        results: Dict[str, Dict[str, Any]] = {}
+
+        payload = [
+            {
+                "jsonrpc": "2.0",
+                "id": i,
+                "method": "getTransaction",
+                "params": [
+                    signature,
+                    {
+                        "encoding": "jsonParsed",
+                        "maxSupportedTransactionVersion": 0,
+                        "commitment": "confirmed"  # Match subscription commitment
+                    }
+                ]
+            }
+            for i, signature in enumerate(signatures)
+        ]
+
+        try:
+            response = self.session.post(self.http_rpc_url, json=payload, timeout=15)
+            if 400 <= response.status_code < 500 and response.status_code != 429:
+                self._disable_batching(f"HTTP {response.status_code}")
+                return {}
+            response.raise_for_status()
+            data = response.json()
+
+            if not isinstance(data, list):
+                self._disable_batching(f"non-list response: {str(data)[:200]}")
+                return {}
+
+            # Batch responses may come back in any order - match on id
+            for item in data:
+                i = item.get("id")
+                if isinstance(i, int) and 0 <= i < len(signatures) and item.get("result"):
+                    results[signatures[i]] = item["result"]
+
+            logger.info(f"[FETCH] ✓ Batch fetched {len(results)}/{len(signatures)} transactions")
+
+        except Exception as e:
+            logger.error(f"[FETCH] Batch fetch of {len(signatures)} transactions failed: {e}")
+
+        return results
+
+    def _disable_batching(self, reason: str):
+        """Stop sending batch requests to a provider that rejects them."""
+        self.batch_supported = False
+        logger.warning(f"[FETCH] RPC provider rejected batch request ({reason}) - fetching one at a time")
+
     def parse_lp_event(self, transaction: Dict[str, Any]) -> Optional[ParsedLPEvent]:
         """
         Parse a transaction into a complete LP event.
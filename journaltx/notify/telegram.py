@@ -10,6 +10,11 @@ from zoneinfo import ZoneInfo
 
 import requests
 
+try:
+    import orjson
+except ImportError:  # optional speedup, requests' stdlib json is the fallback
+    orjson = None
+
 from journaltx.core.config import Config
 from journaltx.core.models import Alert
 from journaltx.core.utils import format_pair_age
@@ -32,6 +37,9 @@ class TelegramNotifier:
         self.trading_enabled = config.trading_enabled
         self.trading_tiers = config.trading_tiers or [10, 25, 50]
 
+        # Keep-alive connection reused across alerts (saves a TLS handshake each)
+        self.session = requests.Session()
+
     def _calculate_ignition_quality(self, alert: Alert) -> tuple[str, str]:
         """
         Calculate ignition quality based on LP before/after and pair age.
@@ -82,6 +90,21 @@ class TelegramNotifier:
         else:
             return "🔴", "Maintenance / Rotation (Ignore)"
 
+    def _post_json(self, url: str, payload: dict, timeout: int = 10) -> requests.Response:
+        """
+        POST a JSON payload to the Bot API.
+
+        Serialized with orjson when available, otherwise via requests.
+        """
+        if orjson is not None:
+            return self.session.post(
+                url,
+                data=orjson.dumps(payload),
+                headers={"Content-Type": "application/json"},
+                timeout=timeout,
+            )
+        return self.session.post(url, json=payload, timeout=timeout)
+
     def _get_market_info(self, pair: str) -> dict:
         """
         Fetch market cap info from DexScreener.
@@ -95,9 +118,9 @@ class TelegramNotifier:
         try:
             base_token = pair.split("/")[0]
             url = f"https://api.dexscreener.com/latest/dex/search/?q={base_token}"
-            response = requests.get(url, timeout=5)
+            response = self.session.get(url, timeout=5)
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content) if orjson is not None else response.json()
 
             if not data.get("pairs"):
                 return None
@@ -306,16 +329,15 @@ Check risk/reward and rules first.</i>"""
         reply_markup = {"inline_keyboard": keyboard_rows}
 
         try:
-            response = requests.post(
+            response = self._post_json(
                 url,
-                json={
+                {
                     "chat_id": self.chat_id,
                     "text": message,
                     "parse_mode": "HTML",
                     "disable_web_page_preview": True,
                     "reply_markup": reply_markup,
                 },
-                timeout=10,
             )
             response.raise_for_status()
 
@@ -339,15 +361,14 @@ Check risk/reward and rules first.</i>"""
         url = f"https://api.telegram.org/bot{self.bot_token}/sendMessage"
 
         try:
-            response = requests.post(
+            response = self._post_json(
                 url,
-                json={
+                {
                     "chat_id": self.chat_id,
                     "text": text,
                     "parse_mode": "HTML",
                     "disable_web_page_preview": True,
                 },
-                timeout=10,
             )
             response.raise_for_status()
 
@@ -9,8 +9,11 @@ from collections import defaultdict
 from datetime import datetime, timedelta
 from typing import List, Optional
 
+from sqlalchemy import select
+
 from journaltx.core.config import Config
-from journaltx.core.models import Alert, Trade
+from journaltx.core.db import session_scope
+from journaltx.core.models import Trade
 from journaltx.review.stats import get_alerts_screener
 
 logger = logging.getLogger(__name__)
@@ -42,25 +45,22 @@ def format_screener_output(
         lines.append("No alerts match criteria.")
         return "\n".join(lines)
 
+    # Pairs a trade was taken on, fetched once for all listed pairs
+    bases = {pair.split("/")[0] for pair in by_pair}
+    with session_scope(config) as session:
+        traded_bases = set(
+            session.execute(
+                select(Trade.pair_base)
+                .where(Trade.pair_base.in_(bases), Trade.pair_quote == "SOL")
+                .distinct()
+            ).scalars()
+        )
+
     # Output by pair
     for pair, pair_alerts in sorted(by_pair.items()):
         lines.append(f"{pair}")
 
-        # Check if trade was taken
-        with config.database_path:
-            from journaltx.core.db import get_session
-            session = get_session(config)
-
-            trade_taken = (
-                session.query(Trade)
-                .filter(
-                    Trade.pair_base == pair.split("/")[0],
-                    Trade.pair_quote == "SOL",
-                )
-                .first()
-            )
-
-            session.close()
+        trade_taken = pair.split("/")[0] in traded_bases
 
         # Summarize alerts
         lp_adds = sum(1 for a in pair_alerts if a.type.value == "lp_add")
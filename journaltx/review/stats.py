@@ -8,7 +8,7 @@ import logging
 from datetime import datetime, timedelta
 from typing import List, Optional
 
-from sqlalchemy import func, and_, or_
+from sqlalchemy import Row, func, and_, or_, select
 
 from journaltx.core.config import Config
 from journaltx.core.models import Trade, Journal, Alert, ContinuationQuality, AlertType
@@ -53,34 +53,35 @@ def get_alerts_screener(
     hours: int = 24,
     alert_type: Optional[str] = None,
     min_sol: Optional[float] = None,
-) -> List[Alert]:
+) -> List[Row]:
     """
     Filter alerts for screener.
 
-    Returns alerts matching criteria.
+    Returns (pair, type, value_sol, triggered_at) rows matching criteria,
+    newest first. Only the columns the screener renders are selected.
     """
     cutoff = datetime.utcnow() - timedelta(hours=hours)
 
-    with session_scope(config) as session:
-        query = session.query(Alert).filter(Alert.triggered_at >= cutoff)
-
-        if alert_type:
-            # Normalize type
-            type_map = {
-                "lp_add": AlertType.LP_ADD,
-                "lp_remove": AlertType.LP_REMOVE,
-                "volume_spike": AlertType.VOLUME_SPIKE,
-            }
-            normalized_type = type_map.get(alert_type.lower())
-            if normalized_type:
-                query = query.filter(Alert.type == normalized_type)
+    stmt = select(
+        Alert.pair, Alert.type, Alert.value_sol, Alert.triggered_at
+    ).where(Alert.triggered_at >= cutoff)
 
-        if min_sol:
-            query = query.filter(Alert.value_sol >= min_sol)
+    if alert_type:
+        # Normalize type
+        type_map = {
+            "lp_add": AlertType.LP_ADD,
+            "lp_remove": AlertType.LP_REMOVE,
+            "volume_spike": AlertType.VOLUME_SPIKE,
+        }
+        normalized_type = type_map.get(alert_type.lower())
+        if normalized_type:
+            stmt = stmt.where(Alert.type == normalized_type)
 
-        alerts = query.order_by(Alert.triggered_at.desc()).all()
+    if min_sol:
+        stmt = stmt.where(Alert.value_sol >= min_sol)
 
-        return alerts
+    with session_scope(config) as session:
+        return session.execute(stmt.order_by(Alert.triggered_at.desc())).all()
 
 
 def get_open_trades(config: Config) -> List[Trade]:
@@ -5,11 +5,10 @@ Generates behavioral summaries for weekly reflection.
 """
 
 import logging
-from collections import Counter
 from datetime import datetime, timedelta
 from typing import List, Optional
 
-from sqlalchemy import func, and_
+from sqlalchemy import and_, case, func, select
 
 from journaltx.core.config import Config
 from journaltx.core.models import Trade, Journal, Alert, ContinuationQuality
@@ -21,20 +20,38 @@ logger = logging.getLogger(__name__)
 def get_weekly_stats(config: Config, days: int = 7) -> dict:
     """
     Calculate trading statistics for the past N days.
+
+    Counters and averages are aggregated in SQL, so only one summary
+    row (plus one row per continuation quality) comes back to Python.
     """
     cutoff = datetime.utcnow() - timedelta(days=days)
 
-    with session_scope(config) as session:
-        # Get trades in period
-        trades = (
-            session.query(Trade)
-            .filter(Trade.timestamp >= cutoff)
-            .order_by(Trade.timestamp)
-            .all()
-        )
+    closed = Trade.exit_price.isnot(None)
+    win = and_(closed, Trade.pnl_pct > 0)
+    loss = and_(closed, Trade.pnl_pct < 0)
 
-        # Count total
-        total_trades = len(trades)
+    with session_scope(config) as session:
+        totals = session.execute(
+            select(
+                func.count(Trade.id),
+                func.count(Trade.exit_price),
+                func.sum(case((win, 1), else_=0)),
+                func.avg(case((win, Trade.pnl_pct))),
+                func.avg(case((loss, Trade.pnl_pct))),
+                func.sum(case((Trade.risk_followed != 0, 1), else_=0)),
+                func.sum(case((Trade.scale_out_used != 0, 1), else_=0)),
+            ).where(Trade.timestamp >= cutoff)
+        ).one()
+
+        (
+            total_trades,
+            closed_count,
+            win_count,
+            avg_win,
+            avg_loss,
+            rules_followed,
+            scale_out_used,
+        ) = totals
 
         if total_trades == 0:
             return {
@@ -46,65 +63,39 @@ def get_weekly_stats(config: Config, days: int = 7) -> dict:
                 "rules_followed_pct": None,
                 "scale_out_used_pct": None,
                 "continuation_breakdown": None,
-                "trades": [],
             }
 
-        # Separate closed and open
-        closed_trades = [t for t in trades if t.exit_price is not None]
-        open_trades = [t for t in trades if t.exit_price is None]
-
-        closed_count = len(closed_trades)
-
-        # Calculate win rate
-        wins = [t for t in closed_trades if t.pnl_pct and t.pnl_pct > 0]
-        losses = [t for t in closed_trades if t.pnl_pct and t.pnl_pct < 0]
-
-        win_rate = (len(wins) / closed_count * 100) if closed_count > 0 else 0
-
-        # Average win/loss
-        avg_win = (
-            sum(t.pnl_pct for t in wins if t.pnl_pct) / len(wins) if wins else None
-        )
-        avg_loss = (
-            sum(t.pnl_pct for t in losses if t.pnl_pct) / len(losses) if losses else None
-        )
-
-        # Rules followed
-        rules_followed = sum(1 for t in trades if t.risk_followed)
-        rules_followed_pct = (rules_followed / total_trades * 100) if total_trades > 0 else 0
-
-        # Scale out used
-        scale_out_used = sum(1 for t in trades if t.scale_out_used)
-        scale_out_used_pct = (scale_out_used / total_trades * 100) if total_trades > 0 else 0
-
-        # Get journal entries
-        trade_ids = [t.id for t in trades]
-        journals = (
-            session.query(Journal)
-            .filter(Journal.trade_id.in_(trade_ids))
-            .all()
+        # Continuation quality breakdown over journals for trades in period
+        continuation_counts = dict(
+            session.execute(
+                select(Journal.continuation_quality, func.count(Journal.id))
+                .join(Trade, Journal.trade_id == Trade.id)
+                .where(Trade.timestamp >= cutoff)
+                .group_by(Journal.continuation_quality)
+            ).all()
         )
 
-        # Continuation quality breakdown
-        continuation_counter = Counter(j.continuation_quality for j in journals)
-        continuation_breakdown = {
-            ContinuationQuality.POOR.value: continuation_counter.get(ContinuationQuality.POOR, 0),
-            ContinuationQuality.MIXED.value: continuation_counter.get(ContinuationQuality.MIXED, 0),
-            ContinuationQuality.STRONG.value: continuation_counter.get(ContinuationQuality.STRONG, 0),
-        }
-
-        return {
-            "total_trades": total_trades,
-            "closed_trades": closed_count,
-            "open_trades": len(open_trades),
-            "win_rate": win_rate,
-            "avg_win": avg_win,
-            "avg_loss": avg_loss,
-            "rules_followed_pct": rules_followed_pct,
-            "scale_out_used_pct": scale_out_used_pct,
-            "continuation_breakdown": continuation_breakdown,
-            "trades": trades,
-        }
+    win_rate = (win_count / closed_count * 100) if closed_count > 0 else 0
+    rules_followed_pct = rules_followed / total_trades * 100
+    scale_out_used_pct = scale_out_used / total_trades * 100
+
+    continuation_breakdown = {
+        ContinuationQuality.POOR.value: continuation_counts.get(ContinuationQuality.POOR, 0),
+        ContinuationQuality.MIXED.value: continuation_counts.get(ContinuationQuality.MIXED, 0),
+        ContinuationQuality.STRONG.value: continuation_counts.get(ContinuationQuality.STRONG, 0),
+    }
+
+    return {
+        "total_trades": total_trades,
+        "closed_trades": closed_count,
+        "open_trades": total_trades - closed_count,
+        "win_rate": win_rate,
+        "avg_win": avg_win,
+        "avg_loss": avg_loss,
+        "rules_followed_pct": rules_followed_pct,
+        "scale_out_used_pct": scale_out_used_pct,
+        "continuation_breakdown": continuation_breakdown,
+    }
 
 
 def format_weekly_review(config: Config, days: int = 7) -> str:
@@ -6,9 +6,13 @@ Handles encrypted wallet storage and signing.
 
 import logging
 import os
+import time
+from functools import lru_cache
 from typing import Optional, Tuple
 
 import base58
+import requests
+from cryptography.exceptions import InvalidTag
 from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 from solders.keypair import Keypair
 from solders.pubkey import Pubkey
@@ -17,6 +21,33 @@ from solana.rpc.api import Client
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=1024)
+def _parse_pubkey(pubkey: str) -> Pubkey:
+    """Parse a base58 pubkey string (cached - the bot polls the same wallets)."""
+    return Pubkey.from_string(pubkey)
+
+
+def _keypair_from_base58(private_key_base58: str) -> Keypair:
+    """
+    Build a Keypair from a base58 private key.
+
+    Solana private keys are 64 bytes (32 private + 32 public)
+    or 32 bytes (private only, public derived). A 32-byte key encodes
+    to at most 44 base58 chars, so longer strings are full keypairs and
+    are decoded by solders in Rust.
+
+    Raises:
+        ValueError: If the key is not valid base58 or has the wrong length
+    """
+    if len(private_key_base58) > 44:
+        return Keypair.from_base58_string(private_key_base58)
+
+    key_bytes = base58.b58decode(private_key_base58)
+    if len(key_bytes) != 32:
+        raise ValueError(f"Invalid key length: {len(key_bytes)} bytes")
+    return Keypair.from_seed(key_bytes)
+
+
 class WalletManager:
     """
     Manages encrypted wallet storage and signing.
@@ -42,6 +73,12 @@ class WalletManager:
         self.aesgcm = AESGCM(self.encryption_key)
         self.rpc_client = Client(rpc_url)
 
+        # Pooled HTTP session + short-lived SOL price cache
+        self.session = requests.Session()
+        self._sol_price_cache: Optional[float] = None
+        self._sol_price_time: float = 0
+        self._cache_ttl = 30  # 30 second cache
+
     def validate_private_key(self, private_key_base58: str) -> Tuple[bool, Optional[str], Optional[str]]:
         """
         Validate a base58 private key.
@@ -53,18 +90,7 @@ class WalletManager:
             Tuple of (is_valid, pubkey_str, error_message)
         """
         try:
-            # Decode base58
-            key_bytes = base58.b58decode(private_key_base58)
-
-            # Solana private keys are 64 bytes (32 private + 32 public)
-            # or 32 bytes (private only, public derived)
-            if len(key_bytes) == 64:
-                keypair = Keypair.from_bytes(key_bytes)
-            elif len(key_bytes) == 32:
-                keypair = Keypair.from_seed(key_bytes)
-            else:
-                return False, None, f"Invalid key length: {len(key_bytes)} bytes"
-
+            keypair = _keypair_from_base58(private_key_base58)
             pubkey = str(keypair.pubkey())
             return True, pubkey, None
 
@@ -104,8 +130,12 @@ class WalletManager:
         try:
             plaintext = self.aesgcm.decrypt(salt, encrypted_wallet, None)
             return plaintext.decode('utf-8')
+        except InvalidTag:
+            # Wrong key or tampered ciphertext - expected failure, no details to format
+            logger.error("Failed to decrypt wallet: authentication tag mismatch")
+            return None
         except Exception as e:
-            logger.error(f"Failed to decrypt wallet: {e}")
+            logger.error("Failed to decrypt wallet: %s", e)
             return None
 
     def get_keypair(self, encrypted_wallet: bytes, salt: bytes) -> Optional[Keypair]:
@@ -124,14 +154,13 @@ class WalletManager:
             return None
 
         try:
-            key_bytes = base58.b58decode(private_key_base58)
-            if len(key_bytes) == 64:
-                return Keypair.from_bytes(key_bytes)
-            elif len(key_bytes) == 32:
-                return Keypair.from_seed(key_bytes)
+            return _keypair_from_base58(private_key_base58)
+        except ValueError:
+            # Malformed base58 or key bytes - expected failure, no details to format
+            logger.error("Failed to create keypair: invalid key data")
             return None
         except Exception as e:
-            logger.error(f"Failed to create keypair: {e}")
+            logger.error("Failed to create keypair: %s", e)
             return None
         finally:
             # Zeroize private key from memory
@@ -148,31 +177,41 @@ class WalletManager:
             Balance in SOL, or None on error
         """
         try:
-            pubkey_obj = Pubkey.from_string(pubkey)
+            pubkey_obj = _parse_pubkey(pubkey)
             response = self.rpc_client.get_balance(pubkey_obj)
             if response.value is not None:
                 return response.value / 1e9  # lamports to SOL
             return None
         except Exception as e:
-            logger.error(f"Failed to get balance: {e}")
+            logger.error("Failed to get balance: %s", e)
             return None
 
     def get_sol_price(self) -> Optional[float]:
         """
         Get current SOL/USD price from CoinGecko.
 
+        Cached for a short TTL so bursts of calls share one request.
+
         Returns:
             SOL price in USD, or None on error
         """
+        now = time.time()
+
+        # Check cache
+        if self._sol_price_cache and (now - self._sol_price_time) < self._cache_ttl:
+            return self._sol_price_cache
+
         try:
-            import requests
-            response = requests.get(
+            response = self.session.get(
                 "https://api.coingecko.com/api/v3/simple/price",
                 params={"ids": "solana", "vs_currencies": "usd"},
-                timeout=5
+                timeout=(2, 5)
             )
             response.raise_for_status()
-            return response.json()["solana"]["usd"]
+            price = response.json()["solana"]["usd"]
+            self._sol_price_cache = price
+            self._sol_price_time = now
+            return price
         except Exception as e:
-            logger.error(f"Failed to get SOL price: {e}")
-            return 200.0  # Fallback price
+            logger.error("Failed to get SOL price: %s", e)
+            return self._sol_price_cache or 200.0  # Fallback price
@@ -7,18 +7,22 @@ Allows creating alerts manually that will be sent to Telegram.
 
 import sys
 from pathlib import Path
-sys.path.insert(0, str(Path(__file__).parent.parent))
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
 
 from dotenv import load_dotenv
 import typer
-from rich.console import Console
 
 from journaltx.core.config import Config
 from journaltx.ingest.manual import log_manual_alert
 from journaltx.notify.telegram import TelegramNotifier
 
 app = typer.Typer(help="Log manual alert with Telegram notification")
-console = Console()
+
+# Plain ANSI output - rich's import cost dominates this one-shot script
+GREEN = "\x1b[32m"
+YELLOW = "\x1b[33m"
+RESET = "\x1b[0m"
 
 
 @app.command()
@@ -49,14 +53,14 @@ def main(
         pair_age_hours=pair_age_hours
     )
 
-    console.print(f"[green]✓ Alert logged: {alert.type.value} {pair} {sol} SOL[/green]")
+    print(f"{GREEN}✓ Alert logged: {alert.type.value} {pair} {sol} SOL{RESET}")
 
     # Send to Telegram
     telegram = TelegramNotifier(config)
     if telegram.send_alert(alert):
-        console.print("[green]✓ Telegram notification sent[/green]")
+        print(f"{GREEN}✓ Telegram notification sent{RESET}")
     else:
-        console.print("[yellow]Telegram not configured or failed[/yellow]")
+        print(f"{YELLOW}Telegram not configured or failed{RESET}")
 
 
 if __name__ == "__main__":
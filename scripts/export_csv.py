@@ -8,21 +8,56 @@ Exports trades or alerts to CSV format for external analysis.
 import sys
 from pathlib import Path
 
+ROOT = Path(__file__).resolve().parent.parent
+
 # Add parent directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(ROOT))
 
 import csv
 import typer
-from datetime import datetime
+from datetime import datetime, timezone
+from functools import lru_cache
 from rich.console import Console
 
 from journaltx.core.config import Config
-from journaltx.core.models import Trade, Alert
-from journaltx.core.db import session_scope
 
 app = typer.Typer(help="Export data to CSV")
 console = Console()
 
+_TRADE_HEADER = (
+    "id",
+    "timestamp",
+    "chain",
+    "pair_base",
+    "pair_quote",
+    "entry_price",
+    "exit_price",
+    "pnl_pct",
+    "risk_followed",
+    "scale_out_used",
+    "notes",
+)
+
+_ALERT_HEADER = (
+    "id",
+    "type",
+    "chain",
+    "pair",
+    "value_sol",
+    "value_usd",
+    "triggered_at",
+    "trade_id",
+)
+
+# 1 MiB write buffer - fewer write syscalls on large exports
+_WRITE_BUFFER = 1 << 20
+
+
+@lru_cache(maxsize=1)
+def _config() -> Config:
+    """Load config once per process, shared by all export commands."""
+    return Config.from_env()
+
 
 @app.command()
 def trades(
@@ -31,33 +66,43 @@ def trades(
     """
     Export all trades to CSV.
     """
-    config = Config.from_env()
+    from sqlalchemy import select
+    from journaltx.core.models import Trade
+    from journaltx.core.db import session_scope
+
+    config = _config()
 
     if not output:
-        output = f"data/trades_export_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}.csv"
+        output = f"data/trades_export_{datetime.now(timezone.utc).strftime('%Y%m%d_%H%M%S')}.csv"
 
     with session_scope(config) as session:
-        trade_query = session.query(Trade).order_by(Trade.timestamp)
-        trades = trade_query.all()
-
-        with open(output, "w", newline="") as f:
+        # Only the exported columns - plain rows, no ORM hydration
+        trade_rows = session.execute(
+            select(
+                Trade.id,
+                Trade.timestamp,
+                Trade.chain,
+                Trade.pair_base,
+                Trade.pair_quote,
+                Trade.entry_price,
+                Trade.exit_price,
+                Trade.pnl_pct,
+                Trade.risk_followed,
+                Trade.scale_out_used,
+                Trade.notes,
+            )
+            .order_by(Trade.timestamp)
+            .execution_options(yield_per=1000)
+        )
+
+        with open(output, "w", newline="", encoding="utf-8", buffering=_WRITE_BUFFER) as f:
             writer = csv.writer(f)
-            writer.writerow([
-                "id",
-                "timestamp",
-                "chain",
-                "pair_base",
-                "pair_quote",
-                "entry_price",
-                "exit_price",
-                "pnl_pct",
-                "risk_followed",
-                "scale_out_used",
-                "notes",
-            ])
-
-            for trade in trades:
-                writer.writerow([
+            writer.writerow(_TRADE_HEADER)
+
+            # Stream rows in batches instead of loading every trade at once
+            trade_count = 0
+            for trade in trade_rows:
+                writer.writerow((
                     trade.id,
                     trade.timestamp.isoformat(),
                     trade.chain,
@@ -69,9 +114,10 @@ def trades(
                     "Yes" if trade.risk_followed else "No",
                     "Yes" if trade.scale_out_used else "No",
                     trade.notes or "",
-                ])
+                ))
+                trade_count += 1
 
-    console.print(f"[green]Exported {len(trades)} trades to {output}[/green]")
+    console.print(f"[green]Exported {trade_count} trades to {output}[/green]")
 
 
 @app.command()
@@ -81,30 +127,40 @@ def alerts(
     """
     Export all alerts to CSV.
     """
-    config = Config.from_env()
+    from sqlalchemy import select
+    from journaltx.core.models import Alert
+    from journaltx.core.db import session_scope
+
+    config = _config()
 
     if not output:
-        output = f"data/alerts_export_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}.csv"
+        output = f"data/alerts_export_{datetime.now(timezone.utc).strftime('%Y%m%d_%H%M%S')}.csv"
 
     with session_scope(config) as session:
-        alert_query = session.query(Alert).order_by(Alert.triggered_at.desc())
-        alerts = alert_query.all()
-
-        with open(output, "w", newline="") as f:
+        # Only the exported columns - plain rows, no ORM hydration
+        alert_rows = session.execute(
+            select(
+                Alert.id,
+                Alert.type,
+                Alert.chain,
+                Alert.pair,
+                Alert.value_sol,
+                Alert.value_usd,
+                Alert.triggered_at,
+                Alert.trade_id,
+            )
+            .order_by(Alert.triggered_at.desc())
+            .execution_options(yield_per=1000)
+        )
+
+        with open(output, "w", newline="", encoding="utf-8", buffering=_WRITE_BUFFER) as f:
             writer = csv.writer(f)
-            writer.writerow([
-                "id",
-                "type",
-                "chain",
-                "pair",
-                "value_sol",
-                "value_usd",
-                "triggered_at",
-                "trade_id",
-            ])
-
-            for alert in alerts:
-                writer.writerow([
+            writer.writerow(_ALERT_HEADER)
+
+            # Stream rows in batches instead of loading every alert at once
+            alert_count = 0
+            for alert in alert_rows:
+                writer.writerow((
                     alert.id,
                     alert.type.value,
                     alert.chain,
@@ -113,9 +169,10 @@ def alerts(
                     alert.value_usd or "",
                     alert.triggered_at.isoformat(),
                     alert.trade_id or "",
-                ])
+                ))
+                alert_count += 1
 
-    console.print(f"[green]Exported {len(alerts)} alerts to {output}[/green]")
+    console.print(f"[green]Exported {alert_count} alerts to {output}[/green]")
 
 
 if __name__ == "__main__":
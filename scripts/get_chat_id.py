@@ -7,17 +7,23 @@ Run this after adding your bot to a group or messaging it.
 
 import sys
 from pathlib import Path
-sys.path.insert(0, str(Path(__file__).parent.parent))
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
 
-import requests
 from rich.console import Console
 from rich.panel import Panel
 from dotenv import load_dotenv
 import os
 
+from journaltx.core.utils import make_retrying_session, update_env_keys
+
 console = Console()
 load_dotenv()
 
+# Same pooled, retrying session as the other setup scripts, reused for
+# getUpdates + sendMessage
+session = make_retrying_session()
+
 token = os.getenv("TELEGRAM_BOT_TOKEN")
 
 console.print(Panel.fit(
@@ -60,14 +66,14 @@ else:
 try:
     console.print("\n[yellow]Fetching Chat ID...[/yellow]")
 
-    response = requests.get(f"https://api.telegram.org/bot{token}/getUpdates")
+    response = session.get(f"https://api.telegram.org/bot{token}/getUpdates", timeout=10)
     data = response.json()
 
     if data.get("ok") and data.get("result"):
         # Show all recent chats
         console.print("\n[bold]Recent chats found:[/bold]\n")
 
-        chats = {}
+        chats: dict[str, int] = {}
         for update in data["result"]:
             if "message" in update:
                 chat = update["message"]["chat"]
@@ -86,14 +92,11 @@ try:
                 else:
                     identifier = f"Chat ID {chat_id}"
 
-                chats[chat_id] = identifier
+                chats.setdefault(identifier, chat_id)
 
         # Display unique chats
-        seen = set()
-        for chat_id, identifier in chats.items():
-            if identifier not in seen:
-                console.print(f"  [cyan]{chat_id}[/cyan] - {identifier}")
-                seen.add(identifier)
+        for identifier, chat_id in chats.items():
+            console.print(f"  [cyan]{chat_id}[/cyan] - {identifier}")
 
         # Get the most recent one
         latest = data["result"][-1]
@@ -116,32 +119,18 @@ try:
             sys.exit(0)
 
         # Update .env
-        env_path = Path(__file__).parent.parent / ".env"
-        lines = env_path.read_text().splitlines()
-        updated = []
-        updated_chat = False
-
-        for line in lines:
-            if line.startswith("TELEGRAM_CHAT_ID="):
-                updated.append(f"TELEGRAM_CHAT_ID={chat_id}")
-                updated_chat = True
-            else:
-                updated.append(line)
-
-        if not updated_chat:
-            updated.append(f"TELEGRAM_CHAT_ID={chat_id}")
-
-        env_path.write_text("\n".join(updated))
+        update_env_keys(ROOT / ".env", {"TELEGRAM_CHAT_ID": str(chat_id)})
         console.print(f"\n[green]✓ Saved to .env[/green]")
 
         # Test message
         console.print("\n[yellow]Sending test message...[/yellow]")
-        test_response = requests.post(
+        test_response = session.post(
             f"https://api.telegram.org/bot{token}/sendMessage",
             json={
                 "chat_id": chat_id,
                 "text": "JournalTX\n\n✓ Telegram is now configured!\n\nYou will receive alerts here.",
             },
+            timeout=10,
         )
         if test_response.json().get("ok"):
             console.print("[green]✓ Test message sent![/green]")
@@ -16,19 +16,34 @@ NOT a mock. NOT a demo. Real on-chain data.
 import sys
 from pathlib import Path
 
+ROOT = Path(__file__).resolve().parent.parent
+
 # Add parent directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(ROOT))
 
 import asyncio
+import contextlib
 import json
 import logging
 import signal
 import time
+from collections import OrderedDict
 from datetime import datetime
-from typing import Optional
+from typing import Callable, Optional
 
 import websockets
 import typer
+from websockets.extensions.permessage_deflate import ClientPerMessageDeflateFactory
+
+try:
+    import orjson
+except ImportError:  # optional speedup, stdlib json is the fallback
+    orjson = None
+
+try:
+    import uvloop
+except ImportError:  # optional speedup, default asyncio loop is the fallback
+    uvloop = None
 from typer import Typer, Option
 from rich.console import Console
 from rich.panel import Panel
@@ -36,12 +51,13 @@ from rich.table import Table
 
 from journaltx.core.config import Config
 from journaltx.core.db import init_db
-from journaltx.core.utils import format_pair_age
+from journaltx.core.utils import format_pair_age, mask_url
 from journaltx.ingest.quicknode.lp_events import LPEventListener
 from journaltx.ingest.quicknode.raydium_subscriptions import (
     get_all_dex_subscriptions,
-    extract_signature_from_notification,
     is_liquidity_addition,
+    parse_log_notification,
+    LP_INDICATORS,
 )
 from journaltx.ingest.quicknode.transaction_parser import SolanaTransactionParser
 from journaltx.notify.telegram import TelegramNotifier
@@ -58,25 +74,203 @@ logging.basicConfig(
 )
 logger = logging.getLogger("listen")
 
+# orjson parses the multi-KB logsNotification frames several times faster
+if orjson is not None:
+    json_loads = orjson.loads
 
-def mask_url(url: str) -> str:
-    """Mask sensitive parts of a URL for safe logging."""
-    if not url:
-        return "Not configured"
+    def json_dumps(obj) -> str:
+        return orjson.dumps(obj).decode()
+else:
+    json_loads = json.loads
+    json_dumps = json.dumps
 
-    try:
-        if "quiknode" in url.lower() or "quicknode" in url.lower():
-            parts = url.split("/")
-            if len(parts) >= 4:
-                base = "/".join(parts[:3])
-                return f"{base}/***MASKED***/"
+# Subscription payloads never change - serialize once, resend on every reconnect
+_SUBSCRIPTION_FRAMES = tuple(
+    (sub["method"], json_dumps(sub)) for sub in get_all_dex_subscriptions()
+)
+
+
+# Keywords is_liquidity_addition() looks for. A logsNotification frame
+# containing none of them can never pass it, so skip parsing it.
+_LP_FRAME_KEYWORDS = tuple(indicator.encode() for indicator in LP_INDICATORS)
+
+
+def may_be_lp_frame(message: str | bytes) -> bool:
+    """
+    Cheap raw-frame prefilter run before JSON decoding.
+
+    Only drops log notifications that cannot be LP additions; errors,
+    subscription acks and anything unrecognised are passed through.
+    """
+    buf = message.encode() if isinstance(message, str) else message
+    if b'"logsNotification"' not in buf[:256]:
+        return True
+    buf = buf.lower()
+    return any(keyword in buf for keyword in _LP_FRAME_KEYWORDS)
+
+
+def short_id(address: Optional[str]) -> str:
+    """Shorten a base58 address to first/last 8 chars for display."""
+    if not address:
+        return "N/A"
+    return f"{address[:8]}...{address[-8:]}"
+
+
+class AsyncTxBatcher:
+    """
+    Coalesce get_transaction calls into JSON-RPC batch requests.
+
+    Signatures submitted within max_queue_time of each other (up to
+    max_batch_size) are fetched with one HTTP POST, run in a worker
+    thread so the event loop keeps reading frames. Signatures the batch
+    misses fall back to concurrent single fetches.
+    """
+
+    def __init__(
+        self,
+        tx_parser: SolanaTransactionParser,
+        max_batch_size: int = 25,
+        max_queue_time: float = 0.05,
+    ):
+        self.tx_parser = tx_parser
+        self.max_batch_size = max_batch_size
+        self.max_queue_time = max_queue_time
+        self._pending: list[tuple[str, asyncio.Future]] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._tasks: set[asyncio.Task] = set()
+
+    async def submit(self, signature: str) -> Optional[dict]:
+        """Queue a signature and wait for its transaction (or None)."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((signature, future))
+
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.max_queue_time, self._flush)
+
+        return await future
+
+    def _flush(self):
+        """Send everything queued so far as one batch."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        batch, self._pending = self._pending, []
+        if batch:
+            task = asyncio.create_task(self._process_batch(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _process_batch(self, batch: list[tuple[str, asyncio.Future]]):
+        """
+        Fetch one batch off the event loop and resolve its futures.
+
+        Batch hits resolve as soon as the batch returns; misses are
+        fetched one by one, concurrently, each resolving on its own.
+        """
+        signatures = [signature for signature, _ in batch]
+        try:
+            results = await asyncio.to_thread(self.tx_parser.get_transactions_batch, signatures)
+        except Exception as e:
+            logger.error("Batch fetch failed: %s", e)
+            results = {}
+
+        misses = []
+        for signature, future in batch:
+            if signature in results:
+                if not future.done():
+                    future.set_result(results[signature])
+            else:
+                misses.append((signature, future))
+
+        if misses:
+            await asyncio.gather(*(self._fetch_single(s, f) for s, f in misses))
+
+    async def _fetch_single(self, signature: str, future: asyncio.Future):
+        """Fetch one transaction (with get_transaction's retries) and resolve it."""
+        try:
+            tx = await asyncio.to_thread(self.tx_parser.get_transaction, signature)
+        except Exception as e:
+            if not future.done():
+                future.set_exception(e)
+            return
+
+        if not future.done():
+            future.set_result(tx)
+
+
+class AlertSender:
+    """
+    Send Telegram alerts from one background task, paced under the rate limit.
+
+    Bursts of LP alerts are queued and sent at most max_per_second, so
+    Telegram doesn't answer a burst with 429s and the listener never waits
+    on the HTTP round-trip.
+    """
+
+    def __init__(
+        self,
+        telegram: TelegramNotifier,
+        max_per_second: float = 1.0,
+        on_sent: Optional[Callable[[], None]] = None,
+    ):
+        self.telegram = telegram
+        self.min_interval = 1.0 / max_per_second
+        self.on_sent = on_sent
+        self.queue: asyncio.Queue = asyncio.Queue()
+        self._task: Optional[asyncio.Task] = None
+
+    def submit(self, alert):
+        """Queue an alert for sending (must be called from the event loop)."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+        self.queue.put_nowait(alert)
+
+    async def _run(self):
+        """Drain the queue, spacing sends by min_interval."""
+        loop = asyncio.get_running_loop()
+        last_sent = 0.0
+
+        while True:
+            alert = await self.queue.get()
+
+            wait = last_sent + self.min_interval - loop.time()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            last_sent = loop.time()
+
+            try:
+                success = await asyncio.to_thread(self.telegram.send_alert, alert)
+            except Exception as e:
+                logger.error("Telegram send failed: %s", e)
+                success = False
 
-        from urllib.parse import urlparse
-        parsed = urlparse(url)
-        return f"{parsed.scheme}://{parsed.netloc}/***MASKED***"
+            if success:
+                console.print("[dim]Telegram notification sent[/dim]")
+                if self.on_sent:
+                    self.on_sent()
+            else:
+                console.print("[yellow]Telegram notification failed[/yellow]")
+
+            self.queue.task_done()
+
+    async def aclose(self, timeout: float = 5.0):
+        """Give queued alerts up to timeout seconds to go out, then stop."""
+        if self._task is None:
+            return
+
+        try:
+            await asyncio.wait_for(self.queue.join(), timeout)
+        except asyncio.TimeoutError:
+            logger.warning("Dropping %d unsent Telegram alerts", self.queue.qsize())
 
-    except Exception:
-        return "***MASKED***"
+        self._task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
 
 
 class LPListener:
@@ -96,12 +290,18 @@ class LPListener:
         self.message_count = 0
         self.lp_events_detected = 0
         self.alerts_sent = 0
+        self.dropped_messages = 0
         self.start_time = None
 
-        # Signature deduplication cache (last 1000 signatures)
-        self.processed_signatures: set = set()
+        # Signature deduplication cache (last 1000 signatures, insertion-ordered)
+        self.processed_signatures: OrderedDict[str, None] = OrderedDict()
         self.max_cache_size = 1000
 
+        # Frame queue between the WebSocket reader and processing workers
+        self.queue: Optional[asyncio.Queue] = None
+        self.max_queue_size = 1024
+        self.num_workers = 8
+
         # Select provider: Helius (primary) or QuickNode (fallback)
         self.provider = "helius" if config.helius_ws_url else "quicknode"
         self.ws_url = config.helius_ws_url or config.quicknode_ws_url
@@ -110,40 +310,47 @@ class LPListener:
         # Initialize components
         self.lp_listener = LPEventListener(config)
         self.tx_parser = None
+        self.tx_batcher = None
         self.telegram = None
+        self.alert_sender = None
 
         if self.rpc_url:
             self.tx_parser = SolanaTransactionParser(self.rpc_url)
+            self.tx_batcher = AsyncTxBatcher(self.tx_parser)
 
         if config.telegram_bot_token and config.telegram_chat_id:
             self.telegram = TelegramNotifier(config)
+            self.alert_sender = AlertSender(self.telegram, on_sent=self._on_alert_sent)
 
-    def handle_alert(self, alert):
-        """Handle generated alert - send to Telegram if configured."""
+    def _on_alert_sent(self):
+        """Count an alert once Telegram has accepted it."""
         self.alerts_sent += 1
 
+    def handle_alert(self, alert):
+        """Handle generated alert - send to Telegram if configured."""
         console.print(Panel(
             f"[bold green]ALERT: {alert.pair}[/bold green]\n"
             f"LP Added: {alert.value_sol:.0f} SOL (~${alert.value_usd:.0f})\n"
-            f"Token: {alert.token_mint[:8]}...{alert.token_mint[-8:] if alert.token_mint else 'N/A'}\n"
-            f"Pool: {alert.pool_address[:8]}...{alert.pool_address[-8:] if alert.pool_address else 'N/A'}\n"
+            f"Token: {short_id(alert.token_mint)}\n"
+            f"Pool: {short_id(alert.pool_address)}\n"
             f"New Pool: {'Yes' if alert.is_new_pool else 'No'}\n"
             f"Age: {format_pair_age(alert.pair_age_hours, short=True)} | MCap: ${alert.market_cap/1e6:.2f}M",
             title="[bold yellow]Early-Stage Opportunity[/bold yellow]",
             border_style="green"
         ))
 
-        if self.telegram:
-            success = self.telegram.send_alert(alert)
-            if success:
-                console.print("[dim]Telegram notification sent[/dim]")
-            else:
-                console.print("[yellow]Telegram notification failed[/yellow]")
+        if self.alert_sender:
+            # Sent in the background, paced under Telegram's rate limit,
+            # and counted once delivered
+            self.alert_sender.submit(alert)
+        else:
+            # Console-only mode: the panel above is the delivery
+            self.alerts_sent += 1
 
-    async def process_message(self, ws_message: str):
+    async def process_message(self, ws_message: str | bytes):
         """Process incoming WebSocket message from QuickNode."""
         try:
-            data = json.loads(ws_message)
+            data = json_loads(ws_message)
 
             # Handle RPC errors (rate limit, auth, etc.)
             if "error" in data:
@@ -151,107 +358,88 @@ class LPListener:
                 error_code = error.get("code", 0)
                 error_msg = error.get("message", "Unknown error")
                 if error_code == -32003:  # Rate limit
-                    logger.error(f"[WS] ⚠️ QuickNode rate limit reached: {error_msg}")
+                    logger.error("[WS] ⚠️ QuickNode rate limit reached: %s", error_msg)
                     console.print(f"[bold red]RATE LIMIT: {error_msg}[/bold red]")
                     # Set longer reconnect delay for rate limit
                     self.reconnect_delay = 60
                 else:
-                    logger.error(f"[WS] ⚠️ RPC Error ({error_code}): {error_msg}")
+                    logger.error("[WS] ⚠️ RPC Error (%s): %s", error_code, error_msg)
                 return
 
             # Handle subscription confirmations
             if "result" in data and isinstance(data["result"], int):
-                logger.info(f"[WS] ✓ Subscription confirmed: ID {data['result']}")
+                logger.info("[WS] ✓ Subscription confirmed: ID %s", data["result"])
                 return
 
-            # Check if this is a logs notification
-            if "params" not in data or "result" not in data["params"]:
+            # Check if this is a logs notification we can act on
+            notification = parse_log_notification(data)
+            if notification is None:
                 return
 
-            result = data["params"]["result"]
-
-            # QuickNode logsNotification has nested structure:
-            # result.value.logs and result.value.err and result.value.signature
-            value = result.get("value", result)  # Fallback to result if no value
-
-            # CHECK: Ignore failed transactions (err != null)
-            if value.get("err") is not None:
-                logger.info(f"[WS] ❌ Ignoring failed transaction: {value.get('err')}")
-                return
-
-            logs = value.get("logs", [])
-
-            if not logs:
-                return
-
-            # Extract transaction signature
-            signature = extract_signature_from_notification(data)
-
-            if not signature:
-                logger.info("[WS] ❌ Could not extract signature from notification")
-                return
+            signature, logs = notification
 
             # CHECK: Deduplicate signatures
-            if signature in self.processed_signatures:
-                logger.info(f"[WS] ⏭️ Skipping duplicate signature: {signature[:12]}...")
+            cache = self.processed_signatures
+            if signature in cache:
+                logger.debug("[WS] ⏭️ Skipping duplicate signature: %.12s...", signature)
                 return
 
-            # Add to cache (with size limit)
-            self.processed_signatures.add(signature)
-            if len(self.processed_signatures) > self.max_cache_size:
-                # Remove oldest (convert to list, remove first 100)
-                to_remove = list(self.processed_signatures)[:100]
-                for sig in to_remove:
-                    self.processed_signatures.discard(sig)
+            # Add to cache (with size limit) - evict oldest first
+            cache[signature] = None
+            if len(cache) > self.max_cache_size:
+                cache.popitem(last=False)
 
             # Log receipt of Raydium log with log preview
-            log_preview = logs[0][:50] if logs else "empty"
-            logger.info(f"[WS] ✓ Received Raydium log: {signature[:16]}...")
-            logger.info(f"[WS]   Log[0]: {log_preview}...")
+            logger.debug("[WS] ✓ Received Raydium log: %.16s...", signature)
+            logger.debug("[WS]   Log[0]: %.50s...", logs[0])
 
             # Check if this looks like a liquidity operation
             if not is_liquidity_addition(logs):
-                logger.info(f"[WS] ⏭️ Not a liquidity addition (no LP keywords in logs)")
+                logger.debug("[WS] ⏭️ Not a liquidity addition (no LP keywords in logs)")
                 return
 
-            if not self.tx_parser:
+            tx_parser = self.tx_parser
+            if not tx_parser:
                 logger.warning("[WS] ⚠️ Transaction parser not initialized (no HTTP URL)")
                 return
 
-            logger.info(f"[LP] ═══════════════════════════════════════════════════════")
-            logger.info(f"[LP] POTENTIAL LP DETECTED: {signature[:16]}...")
-            logger.info(f"[LP] Fetching full transaction from QuickNode HTTP RPC...")
+            logger.info("[LP] ═══════════════════════════════════════════════════════")
+            logger.info("[LP] POTENTIAL LP DETECTED: %.16s...", signature)
+            logger.info("[LP] Fetching full transaction from QuickNode HTTP RPC...")
 
-            # Fetch full transaction
-            transaction = self.tx_parser.get_transaction(signature)
+            # Fetch full transaction (batched with other in-flight candidates)
+            transaction = await self.tx_batcher.submit(signature)
 
             if not transaction:
-                logger.warning(f"[LP] ❌ Could not fetch transaction: {signature[:16]}...")
+                logger.warning("[LP] ❌ Could not fetch transaction: %.16s...", signature)
                 return
 
-            logger.info(f"[LP] ✓ Transaction fetched, starting decode...")
+            logger.info("[LP] ✓ Transaction fetched, starting decode...")
 
-            # Parse the LP event (this does the real on-chain decoding)
-            parsed_event = self.tx_parser.parse_lp_event(transaction)
+            # Parse the LP event (real on-chain decoding + HTTP metadata lookups,
+            # so run it off the event loop)
+            parsed_event = await asyncio.to_thread(tx_parser.parse_lp_event, transaction)
 
             if not parsed_event:
-                logger.info(f"[LP] ❌ Transaction is not an LP addition or failed to parse")
-                logger.info(f"[LP] ═══════════════════════════════════════════════════════")
+                logger.info("[LP] ❌ Transaction is not an LP addition or failed to parse")
+                logger.info("[LP] ═══════════════════════════════════════════════════════")
                 return
 
             self.lp_events_detected += 1
 
-            logger.info(f"[LP] ✓ LP EVENT #{self.lp_events_detected} CONFIRMED!")
-            logger.info(f"[LP]   Pair: {parsed_event.pair_string}")
-            logger.info(f"[LP]   SOL Added: +{parsed_event.sol_amount:.2f} SOL (~${parsed_event.sol_amount_usd:,.0f})")
-            logger.info(f"[LP]   Token Added: +{parsed_event.token_amount:,.0f}")
-            logger.info(f"[LP]   Token Mint: {parsed_event.token_mint}")
-            logger.info(f"[LP]   Pool: {parsed_event.pool_address}")
-            logger.info(f"[LP]   New Pool: {parsed_event.is_new_pool}")
-            logger.info(f"[LP]   Liquidity: {parsed_event.liquidity_sol:.2f} SOL (~${parsed_event.liquidity_usd:,.0f})")
-            logger.info(f"[LP]   Market Cap: ${parsed_event.market_cap:,.0f}")
-            logger.info(f"[LP]   Pair Age: {format_pair_age(parsed_event.pair_age_hours)}")
-            logger.info(f"[LP]   DexScreener: {parsed_event.dexscreener_url}")
+            # Event summary needs number formatting - only build it if INFO is on
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(f"[LP] ✓ LP EVENT #{self.lp_events_detected} CONFIRMED!")
+                logger.info(f"[LP]   Pair: {parsed_event.pair_string}")
+                logger.info(f"[LP]   SOL Added: +{parsed_event.sol_amount:.2f} SOL (~${parsed_event.sol_amount_usd:,.0f})")
+                logger.info(f"[LP]   Token Added: +{parsed_event.token_amount:,.0f}")
+                logger.info(f"[LP]   Token Mint: {parsed_event.token_mint}")
+                logger.info(f"[LP]   Pool: {parsed_event.pool_address}")
+                logger.info(f"[LP]   New Pool: {parsed_event.is_new_pool}")
+                logger.info(f"[LP]   Liquidity: {parsed_event.liquidity_sol:.2f} SOL (~${parsed_event.liquidity_usd:,.0f})")
+                logger.info(f"[LP]   Market Cap: ${parsed_event.market_cap:,.0f}")
+                logger.info(f"[LP]   Pair Age: {format_pair_age(parsed_event.pair_age_hours)}")
+                logger.info(f"[LP]   DexScreener: {parsed_event.dexscreener_url}")
 
             console.print(
                 f"[cyan]LP Event:[/cyan] {parsed_event.pair_string} | "
@@ -260,34 +448,60 @@ class LPListener:
                 f"MCap: ${parsed_event.market_cap/1e6:.2f}M"
             )
 
-            logger.info(f"[FILTER] Applying early-stage filters...")
+            logger.info("[FILTER] Applying early-stage filters...")
 
-            # Process through LP listener (applies filters and creates alert)
-            alert = self.lp_listener.process_parsed_lp_event(
-                parsed_event,
-                on_alert=self.handle_alert
+            # Process through LP listener (applies filters and creates alert).
+            # The DexScreener lookup and DB write block, so they run in a
+            # thread and the other workers keep going meanwhile.
+            alert = await asyncio.to_thread(
+                self.lp_listener.process_parsed_lp_event, parsed_event
             )
 
+            if alert and alert.early_stage_passed:
+                self.handle_alert(alert)
+
             if alert and not alert.early_stage_passed:
-                logger.info(f"[FILTER] ❌ Filtered out: early_stage_passed=False")
+                logger.info("[FILTER] ❌ Filtered out: early_stage_passed=False")
                 console.print(f"[dim]  └── Filtered: early_stage_passed=False[/dim]")
             elif alert:
-                logger.info(f"[FILTER] ✓ Passed all filters! Alert sent.")
+                logger.info("[FILTER] ✓ Passed all filters! Alert raised.")
             else:
-                logger.info(f"[FILTER] ❌ Filtered out by early_meme.py rules")
+                logger.info("[FILTER] ❌ Filtered out by early_meme.py rules")
 
-            logger.info(f"[LP] ═══════════════════════════════════════════════════════")
+            logger.info("[LP] ═══════════════════════════════════════════════════════")
 
         except json.JSONDecodeError as e:
-            logger.error(f"Invalid JSON: {e}")
+            logger.error("Invalid JSON: %s", e)
         except Exception as e:
-            logger.error(f"Error processing message: {e}", exc_info=True)
+            logger.error("Error processing message: %s", e, exc_info=True)
+
+    async def _worker(self):
+        """Process queued frames until cancelled."""
+        while True:
+            message = await self.queue.get()
+            try:
+                await self.process_message(message)
+            finally:
+                self.queue.task_done()
 
     async def connect_and_listen(self):
         """Connect to WebSocket and listen for events with auto-reconnection."""
         self.running = True
         self.start_time = datetime.now()
 
+        # Decouple recv from processing: the reader only enqueues, workers
+        # await RPC/Telegram, so slow candidates never stall the socket
+        self.queue = asyncio.Queue(maxsize=self.max_queue_size)
+        workers = [asyncio.create_task(self._worker()) for _ in range(self.num_workers)]
+
+        try:
+            await self._reconnect_loop()
+        finally:
+            for worker in workers:
+                worker.cancel()
+
+    async def _reconnect_loop(self):
+        """Keep a WebSocket connection open, reconnecting with backoff."""
         provider_name = self.provider.capitalize()
 
         while self.running:
@@ -296,9 +510,23 @@ class LPListener:
 
                 async with websockets.connect(
                     self.ws_url,
-                    ping_interval=30,
-                    ping_timeout=10,
+                    # Detect half-open connections within ~30s
+                    ping_interval=20,
+                    ping_timeout=8,
                     close_timeout=5,
+                    # Bounded frame buffer - applies TCP backpressure if we fall behind
+                    max_queue=32,
+                    # logsNotification JSON compresses well - negotiate deflate
+                    # explicitly with full-size windows
+                    extensions=[
+                        ClientPerMessageDeflateFactory(
+                            client_max_window_bits=15,
+                            server_max_window_bits=15,
+                            compress_settings={"memLevel": 5},
+                        )
+                    ],
+                    # Large log dumps can exceed the 1 MiB default frame limit
+                    max_size=8 * 1024 * 1024,
                 ) as ws:
                     self.ws = ws
                     self.reconnect_delay = 1  # Reset delay on successful connection
@@ -306,20 +534,29 @@ class LPListener:
                     console.print(f"[bold green]Connected to {provider_name}![/bold green]\n")
 
                     # Subscribe to DEX logs
-                    subscriptions = get_all_dex_subscriptions()
-                    console.print(f"[bold]Subscribing to {len(subscriptions)} DEX program(s)...[/bold]")
+                    console.print(f"[bold]Subscribing to {len(_SUBSCRIPTION_FRAMES)} DEX program(s)...[/bold]")
 
-                    for sub in subscriptions:
-                        await ws.send(json.dumps(sub))
-                        logger.info(f"Sent subscription: {sub['method']}")
+                    for method, frame in _SUBSCRIPTION_FRAMES:
+                        await ws.send(frame)
+                        logger.info("Sent subscription: %s", method)
 
                     # Print status
                     self._print_status()
 
                     # Listen for messages
+                    queue = self.queue
                     async for message in ws:
                         self.message_count += 1
-                        await self.process_message(message)
+                        if may_be_lp_frame(message):
+                            try:
+                                queue.put_nowait(message)
+                            except asyncio.QueueFull:
+                                # Workers can't keep up - shed load, warn every 100 drops
+                                if not self.dropped_messages % 100:
+                                    logger.warning(
+                                        "Frame queue full (%d), dropping frames", self.max_queue_size
+                                    )
+                                self.dropped_messages += 1
 
                         # Print periodic status
                         if self.message_count % 100 == 0:
@@ -360,10 +597,16 @@ class LPListener:
         runtime = datetime.now() - self.start_time if self.start_time else None
         runtime_str = str(runtime).split('.')[0] if runtime else "N/A"
 
+        # Round-trip time of the last keepalive ping (0 until the first pong)
+        latency_ms = self.ws.latency * 1000 if self.ws else 0
+
         console.print(
             f"[dim]Stats: {self.message_count} msgs | "
             f"{self.lp_events_detected} LP events | "
             f"{self.alerts_sent} alerts | "
+            f"{self.dropped_messages} dropped | "
+            f"queue {self.queue.qsize() if self.queue else 0}/{self.max_queue_size} | "
+            f"ping {latency_ms:.0f}ms | "
             f"Runtime: {runtime_str}[/dim]"
         )
 
@@ -472,11 +715,17 @@ def main(
         except asyncio.CancelledError:
             pass
         finally:
+            if listener.alert_sender:
+                await listener.alert_sender.aclose()
             if telegram_bot:
                 await telegram_bot.stop()
 
+    # uvloop cuts per-callback overhead on the hot `async for message in ws` loop
+    loop_factory = uvloop.new_event_loop if uvloop is not None else None
+
     try:
-        asyncio.run(run_all())
+        with asyncio.Runner(loop_factory=loop_factory) as runner:
+            runner.run(run_all())
     except KeyboardInterrupt:
         pass
 
@@ -9,8 +9,10 @@ Forces reflection and journaling.
 import sys
 from pathlib import Path
 
+ROOT = Path(__file__).resolve().parent.parent
+
 # Add parent directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(ROOT))
 
 from datetime import datetime
 import typer
@@ -18,14 +20,33 @@ from rich.console import Console
 from rich.prompt import Prompt, Confirm
 
 from journaltx.core.config import Config
-from journaltx.core.models import Trade, Journal, ContinuationQuality
-from journaltx.core.db import session_scope
-from journaltx.guardrails.rules import print_guardrails
 
 app = typer.Typer(help="Log a trade manually")
 console = Console()
 
 
+def _insert_trades(session, trade_rows: list[dict], journal_rows: list[dict]) -> list[int]:
+    """
+    Insert trades and their journals with Core executemany.
+
+    journal_rows[i] belongs to trade_rows[i]; its trade_id is filled in
+    from the inserted trade. Returns the new trade ids in input order.
+    """
+    from sqlalchemy import insert
+    from journaltx.core.models import Trade, Journal
+
+    trade_ids = session.execute(
+        insert(Trade).returning(Trade.id, sort_by_parameter_order=True),
+        trade_rows,
+    ).scalars().all()
+
+    for trade_id, journal_row in zip(trade_ids, journal_rows):
+        journal_row["trade_id"] = trade_id
+    session.execute(insert(Journal), journal_rows)
+
+    return list(trade_ids)
+
+
 @app.command()
 def main(
     pair_base: str = typer.Option(..., "--pair", "-p", help="Base token (e.g., TOKEN)"),
@@ -37,6 +58,10 @@ def main(
 
     Prompts for all required information.
     """
+    from journaltx.core.models import ContinuationQuality
+    from journaltx.core.db import session_scope
+    from journaltx.guardrails.rules import print_guardrails
+
     config = Config.from_env()
 
     # Print guardrails first
@@ -78,36 +103,34 @@ def main(
     )
 
     # Build notes
-    full_notes = notes or ""
-    full_notes += f"\n\nWhy entered: {why_enter}"
-    full_notes += f"\nRisk defined: {'Yes' if risk_defined else 'No'}"
-    full_notes += f"\nScale-out: {'Yes' if scale_out else 'No'}"
-    full_notes += f"\nInvalidation: {invalidation}"
+    full_notes = "\n".join([
+        notes or "",
+        "",
+        f"Why entered: {why_enter}",
+        f"Risk defined: {'Yes' if risk_defined else 'No'}",
+        f"Scale-out: {'Yes' if scale_out else 'No'}",
+        f"Invalidation: {invalidation}",
+    ]).strip()
 
     # Save trade and journal
     with session_scope(config) as session:
-        trade = Trade(
-            pair_base=pair_base.upper(),
-            pair_quote=pair_quote,
-            entry_price=entry_price,
-            risk_followed=rule_followed,
-            scale_out_used=scale_out,
-            notes=full_notes.strip(),
-            timestamp=datetime.utcnow(),
-        )
-        session.add(trade)
-        session.flush()
-
-        # Add journal
-        journal = Journal(
-            trade_id=trade.id,
-            rule_followed=rule_followed,
-            continuation_quality=continuation,
-            lesson=lesson,
-        )
-        session.add(journal)
-
-        console.print(f"\n[green]Trade #{trade.id} logged successfully.[/green]\n")
+        trade_row = {
+            "pair_base": pair_base.upper(),
+            "pair_quote": pair_quote,
+            "entry_price": entry_price,
+            "risk_followed": rule_followed,
+            "scale_out_used": scale_out,
+            "notes": full_notes,
+            "timestamp": datetime.utcnow(),
+        }
+        journal_row = {
+            "rule_followed": rule_followed,
+            "continuation_quality": continuation,
+            "lesson": lesson,
+        }
+        trade_id = _insert_trades(session, [trade_row], [journal_row])[0]
+
+        console.print(f"\n[green]Trade #{trade_id} logged successfully.[/green]\n")
 
 
 @app.command()
@@ -118,32 +141,41 @@ def exit_trade(
     """
     Mark a trade as closed with exit price.
     """
+    from sqlalchemy import case, select, update
+    from journaltx.core.models import Trade
+    from journaltx.core.db import session_scope
+
     config = Config.from_env()
 
+    # Close and compute PnL % in one statement; the WHERE clause makes the
+    # "already closed" check atomic
+    pnl_pct = case(
+        (Trade.entry_price > 0, (exit_price - Trade.entry_price) / Trade.entry_price * 100),
+        else_=0,
+    )
+    stmt = (
+        update(Trade)
+        .where(Trade.id == trade_id, Trade.exit_price.is_(None))
+        .values(exit_price=exit_price, pnl_pct=pnl_pct)
+        .returning(Trade.pnl_pct)
+    )
+
     with session_scope(config) as session:
-        trade = session.query(Trade).filter(Trade.id == trade_id).first()
+        closed_pnl = session.execute(stmt).scalar_one_or_none()
 
-        if not trade:
-            console.print(f"[red]Trade #{trade_id} not found.[/red]")
-            raise typer.Exit(1)
+        if closed_pnl is None:
+            existing_exit = session.execute(
+                select(Trade.exit_price).where(Trade.id == trade_id)
+            ).one_or_none()
 
-        if trade.exit_price:
-            console.print(f"[yellow]Trade #{trade_id} already closed at {trade.exit_price}[/yellow]")
+            if existing_exit is None:
+                console.print(f"[red]Trade #{trade_id} not found.[/red]")
+            else:
+                console.print(f"[yellow]Trade #{trade_id} already closed at {existing_exit[0]}[/yellow]")
             raise typer.Exit(1)
 
-        # Update trade
-        trade.exit_price = exit_price
-
-        # Calculate PnL %
-        if trade.entry_price > 0:
-            trade.pnl_pct = ((exit_price - trade.entry_price) / trade.entry_price) * 100
-        else:
-            trade.pnl_pct = 0
-
-        session.add(trade)
-
-        pnl_str = f"+{trade.pnl_pct:.2f}%" if trade.pnl_pct >= 0 else f"{trade.pnl_pct:.2f}%"
-        console.print(f"\n[green]Trade #{trade_id} closed at {exit_price} ({pnl_str})[/green]\n")
+    pnl_str = f"+{closed_pnl:.2f}%" if closed_pnl >= 0 else f"{closed_pnl:.2f}%"
+    console.print(f"\n[green]Trade #{trade_id} closed at {exit_price} ({pnl_str})[/green]\n")
 
 
 if __name__ == "__main__":
@@ -6,11 +6,12 @@ View and switch between trading profiles.
 """
 
 import sys
-import re
 from pathlib import Path
 
+ROOT = Path(__file__).resolve().parent.parent
+
 # Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(ROOT))
 
 import typer
 
@@ -23,7 +24,7 @@ def current():
     from dotenv import load_dotenv
     from journaltx.core.config import Config
 
-    load_dotenv()
+    load_dotenv(ROOT / ".env")
     config = Config.from_env()
 
     typer.echo(config.get_filter_summary())
@@ -34,8 +35,8 @@ def list():
     """List all available profiles."""
     from journaltx.core.config import Config
 
-    profiles_dir = Path("config/profiles")
-    filters_dir = Path("config/filters")
+    profiles_dir = ROOT / "config" / "profiles"
+    filters_dir = ROOT / "config" / "filters"
 
     typer.secho("\n📊 Available Profiles:", bold=True)
     typer.echo("─" * 50)
@@ -86,45 +87,36 @@ def switch(
 ):
     """Switch to a different profile (updates .env file)."""
     from dotenv import load_dotenv
+    from journaltx.core.utils import update_env_keys
 
-    load_dotenv()
-    env_path = Path(".env")
+    env_path = ROOT / ".env"
+    load_dotenv(env_path)
 
     if not env_path.exists():
         typer.secho("Error: .env file not found!", fg=typer.colors.RED)
         raise typer.Exit(1)
 
     # Validate profile exists
-    profile_path = Path(f"config/profiles/{profile}.json")
+    profile_path = ROOT / "config" / "profiles" / f"{profile}.json"
     if not profile_path.exists():
         typer.secho(f"Error: Profile '{profile}' not found!", fg=typer.colors.RED)
         typer.echo("Run: python scripts/profile.py list")
         raise typer.Exit(1)
 
-    # Read .env
-    content = env_path.read_text()
-
-    # Update PROFILE_TEMPLATE
-    if "PROFILE_TEMPLATE=" in content:
-        content = re.sub(r"PROFILE_TEMPLATE=.*", f"PROFILE_TEMPLATE={profile}", content)
-    else:
-        content += f"\nPROFILE_TEMPLATE={profile}\n"
+    updates = {"PROFILE_TEMPLATE": profile}
 
     # Update FILTER_TEMPLATE if provided
     if filter:
-        filter_path = Path(f"config/filters/{filter}.json")
+        filter_path = ROOT / "config" / "filters" / f"{filter}.json"
         if not filter_path.exists():
             typer.secho(f"Error: Filter '{filter}' not found!", fg=typer.colors.RED)
             typer.echo("Run: python scripts/profile.py list")
             raise typer.Exit(1)
 
-        if "FILTER_TEMPLATE=" in content:
-            content = re.sub(r"FILTER_TEMPLATE=.*", f"FILTER_TEMPLATE={filter}", content)
-        else:
-            content += f"FILTER_TEMPLATE={filter}\n"
+        updates["FILTER_TEMPLATE"] = filter
 
-    # Write back
-    env_path.write_text(content)
+    # Rewrite the template keys in .env (one pass, atomic write)
+    update_env_keys(env_path, updates)
 
     # Update environment variables so Config.from_env() sees the new values
     import os
@@ -8,14 +8,15 @@ Shows behavioral metrics and suggests ONE change for next week.
 import sys
 from pathlib import Path
 
+ROOT = Path(__file__).resolve().parent.parent
+
 # Add parent directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(ROOT))
 
 import typer
 from rich.console import Console
 
 from journaltx.core.config import Config
-from journaltx.review.weekly import print_weekly_review, export_weekly_review
 
 app = typer.Typer(help="Weekly review")
 console = Console()
@@ -32,6 +33,8 @@ def main(
 
     Shows trades, win rate, discipline metrics, and suggests ONE change.
     """
+    from journaltx.review.weekly import format_weekly_review, export_weekly_review
+
     config = Config.from_env()
 
     review_text = format_weekly_review(config, days)
@@ -9,14 +9,15 @@ Never suggests trades.
 import sys
 from pathlib import Path
 
+ROOT = Path(__file__).resolve().parent.parent
+
 # Add parent directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(ROOT))
 
 import typer
 from rich.console import Console
 
 from journaltx.core.config import Config
-from journaltx.review.screener import print_screener
 
 app = typer.Typer(help="Screener for historical alerts")
 console = Console()
@@ -34,6 +35,8 @@ def main(
     Example:
         python scripts/screener.py --last 24h --type lp_add --min-sol 500
     """
+    from journaltx.review.screener import print_screener
+
     config = Config.from_env()
 
     print_screener(config, hours, type, min_sol)
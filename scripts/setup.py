@@ -6,26 +6,35 @@ Guides users through initial configuration with validation.
 """
 
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+ROOT = Path(__file__).resolve().parent.parent
+
 # Add parent directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(ROOT))
 
 import requests
 import typer
 from rich.console import Console
 from rich.panel import Panel
 from rich.prompt import Prompt, Confirm
+from rich.text import Text
 from rich import print as rprint
 
+from journaltx.core.utils import make_retrying_session
+
 app = typer.Typer(help="Interactive setup wizard")
 console = Console()
 
+# Pooled, retrying session shared by the connection tests
+session = make_retrying_session()
+
 
 def test_quicknode(http_url: str) -> bool:
     """Test QuickNode connection."""
     try:
-        response = requests.post(
+        response = session.post(
             http_url,
             json={
                 "jsonrpc": "2.0",
@@ -41,7 +50,8 @@ def test_quicknode(http_url: str) -> bool:
             return True
         return False
 
-    except Exception:
+    # ValueError/AttributeError: body isn't a JSON object (e.g. a proxy error page)
+    except (requests.RequestException, ValueError, AttributeError):
         return False
 
 
@@ -49,7 +59,7 @@ def test_telegram(bot_token: str, chat_id: str) -> bool:
     """Test Telegram bot connection."""
     try:
         # Test bot info
-        response = requests.get(
+        response = session.get(
             f"https://api.telegram.org/bot{bot_token}/getMe",
             timeout=10,
         )
@@ -60,7 +70,7 @@ def test_telegram(bot_token: str, chat_id: str) -> bool:
             return False
 
         # Send test message
-        response = requests.post(
+        response = session.post(
             f"https://api.telegram.org/bot{bot_token}/sendMessage",
             json={
                 "chat_id": chat_id,
@@ -71,7 +81,7 @@ def test_telegram(bot_token: str, chat_id: str) -> bool:
         response.raise_for_status()
         return response.json().get("ok", False)
 
-    except Exception:
+    except (requests.RequestException, ValueError, AttributeError):
         return False
 
 
@@ -158,7 +168,7 @@ def main(
             console=console,
         )
 
-    # Test Telegram
+    # Test Telegram (sends a real message, so only once QuickNode is settled)
     console.print("\n[yellow]Testing Telegram connection...[/yellow]")
     if test_telegram(telegram_token, telegram_chat):
         console.print("[green]✓ Telegram connection successful[/green]")
@@ -175,8 +185,13 @@ def main(
     manager = ProfileManager()
 
     console.print("Choose your trading style:\n")
-    for name, prof in BUILT_IN_PROFILES.items():
-        console.print(f"  [cyan]{name}[/cyan] - {prof.description}")
+    # Styled spans instead of markup: one print, and descriptions are
+    # rendered verbatim rather than parsed for [tags]
+    menu = Text("\n").join(
+        Text.assemble(("  " + name, "cyan"), f" - {prof.description}")
+        for name, prof in BUILT_IN_PROFILES.items()
+    )
+    console.print(menu)
 
     console.print("")
     profile = Prompt.ask(
@@ -195,7 +210,9 @@ def main(
     # Write to .env
     console.print("\n")
     if Confirm.ask("Save configuration to .env file?", console=console, default=True):
-        env_path = Path(__file__).parent.parent / ".env"
+        from journaltx.core.utils import write_text_atomic
+
+        env_path = ROOT / ".env"
 
         env_content = f"""# JournalTX Configuration
 # Generated by setup wizard
@@ -222,7 +239,7 @@ VOLUME_SPIKE_MULTIPLIER={selected_profile.volume_spike_multiplier}
 MAX_TRADES_PER_DAY={selected_profile.max_trades_per_day}
 """
 
-        env_path.write_text(env_content)
+        write_text_atomic(env_path, env_content)
         console.print(f"\n[green]✓ Configuration saved to {env_path}[/green]")
 
     console.print("\n")
@@ -249,28 +266,35 @@ def validate():
 
     console.print("[bold]Validating Configuration...[/bold]\n")
 
-    # Check QuickNode
     quicknode = os.getenv("QUICKNODE_HTTP_URL")
-    if quicknode:
-        console.print("QuickNode:", end=" ")
-        if test_quicknode(quicknode):
-            console.print("[green]✓ OK[/green]")
-        else:
-            console.print("[red]✗ Failed[/red]")
-    else:
-        console.print("QuickNode: [yellow]Not configured[/yellow]")
-
-    # Check Telegram
     token = os.getenv("TELEGRAM_BOT_TOKEN")
     chat = os.getenv("TELEGRAM_CHAT_ID")
-    if token and chat:
-        console.print("Telegram:", end=" ")
-        if test_telegram(token, chat):
-            console.print("[green]✓ OK[/green]")
+
+    # Network probes are independent - run them together so the worst case
+    # is the slowest probe, not the sum of their timeouts
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        quicknode_check = executor.submit(test_quicknode, quicknode) if quicknode else None
+        telegram_check = executor.submit(test_telegram, token, chat) if token and chat else None
+
+        # Check QuickNode
+        if quicknode_check:
+            console.print("QuickNode:", end=" ")
+            if quicknode_check.result():
+                console.print("[green]✓ OK[/green]")
+            else:
+                console.print("[red]✗ Failed[/red]")
         else:
-            console.print("[red]✗ Failed[/red]")
-    else:
-        console.print("Telegram: [yellow]Not configured[/yellow]")
+            console.print("QuickNode: [yellow]Not configured[/yellow]")
+
+        # Check Telegram
+        if telegram_check:
+            console.print("Telegram:", end=" ")
+            if telegram_check.result():
+                console.print("[green]✓ OK[/green]")
+            else:
+                console.print("[red]✗ Failed[/red]")
+        else:
+            console.print("Telegram: [yellow]Not configured[/yellow]")
 
     # Check profile
     from journaltx.core.profiles import ProfileManager
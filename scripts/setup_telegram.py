@@ -8,8 +8,10 @@ Guides you through creating and configuring a Telegram bot for JournalTX.
 import sys
 from pathlib import Path
 
+ROOT = Path(__file__).resolve().parent.parent
+
 # Add parent directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(ROOT))
 
 import requests
 import typer
@@ -18,9 +20,14 @@ from rich.panel import Panel
 from rich.prompt import Prompt, Confirm
 from rich import print as rprint
 
+from journaltx.core.utils import make_retrying_session
+
 app = typer.Typer(help="Setup Telegram bot for JournalTX")
 console = Console()
 
+# Pooled, retrying session shared by every Telegram API call
+session = make_retrying_session()
+
 
 def print_step(step: int, title: str):
     """Print a step header."""
@@ -30,7 +37,7 @@ def print_step(step: int, title: str):
 def check_token(token: str) -> bool:
     """Verify if bot token is valid."""
     try:
-        response = requests.get(f"https://api.telegram.org/bot{token}/getMe", timeout=10)
+        response = session.get(f"https://api.telegram.org/bot{token}/getMe", timeout=10)
         data = response.json()
 
         if data.get("ok"):
@@ -41,7 +48,8 @@ def check_token(token: str) -> bool:
         else:
             console.print(f"[red]✗ Invalid token: {data.get('description')}[/red]")
             return False
-    except Exception as e:
+    # ValueError/AttributeError: body isn't a JSON object (e.g. a proxy error page)
+    except (requests.RequestException, ValueError, AttributeError) as e:
         console.print(f"[red]✗ Error checking token: {e}[/red]")
         return False
 
@@ -51,12 +59,16 @@ def get_chat_id(token: str) -> str:
     console.print("\n[yellow]Getting your Chat ID...[/yellow]")
     console.print("1. [bold]Open Telegram and message your bot[/bold]")
     console.print("   Send any message: /start")
-    console.print("\n2. [bold]Wait 10 seconds, then press Enter[/bold]")
-
-    input("\n   Press Enter after sending message...")
+    console.print("\n   Waiting for your message (up to 30 seconds)...")
 
     try:
-        response = requests.get(f"https://api.telegram.org/bot{token}/getUpdates", timeout=10)
+        # Long-poll: Telegram holds the request open until an update arrives,
+        # so there's no need to time a retry against the user
+        response = session.get(
+            f"https://api.telegram.org/bot{token}/getUpdates",
+            params={"timeout": 30, "offset": -1},
+            timeout=35,
+        )
         data = response.json()
 
         if data.get("ok") and data.get("result"):
@@ -71,7 +83,7 @@ def get_chat_id(token: str) -> str:
         else:
             console.print("[red]✗ No messages found. Did you message your bot?[/red]")
             return None
-    except Exception as e:
+    except (requests.RequestException, ValueError, AttributeError, KeyError, TypeError) as e:
         console.print(f"[red]✗ Error getting updates: {e}[/red]")
         return None
 
@@ -87,7 +99,7 @@ This is a test message from your JournalTX bot.
 If you see this, Telegram is configured correctly!"""
 
     try:
-        response = requests.post(
+        response = session.post(
             f"https://api.telegram.org/bot{token}/sendMessage",
             json={
                 "chat_id": chat_id,
@@ -105,42 +117,19 @@ If you see this, Telegram is configured correctly!"""
         else:
             console.print(f"[red]✗ Failed: {data.get('description')}[/red]")
             return False
-    except Exception as e:
+    except (requests.RequestException, ValueError, AttributeError) as e:
         console.print(f"[red]✗ Error: {e}[/red]")
         return False
 
 
 def update_env_file(token: str, chat_id: str):
     """Update .env file with Telegram credentials."""
-    env_path = Path(__file__).parent.parent / ".env"
+    from journaltx.core.utils import update_env_keys
+
+    env_path = ROOT / ".env"
 
     try:
-        # Read existing file
-        lines = env_path.read_text().splitlines()
-
-        # Update or add Telegram credentials
-        updated = []
-        token_added = False
-        chat_added = False
-
-        for line in lines:
-            if line.startswith("TELEGRAM_BOT_TOKEN="):
-                updated.append(f"TELEGRAM_BOT_TOKEN={token}")
-                token_added = True
-            elif line.startswith("TELEGRAM_CHAT_ID="):
-                updated.append(f"TELEGRAM_CHAT_ID={chat_id}")
-                chat_added = True
-            else:
-                updated.append(line)
-
-        # Add if not present
-        if not token_added:
-            updated.append(f"TELEGRAM_BOT_TOKEN={token}")
-        if not chat_added:
-            updated.append(f"TELEGRAM_CHAT_ID={chat_id}")
-
-        # Write back
-        env_path.write_text("\n".join(updated))
+        update_env_keys(env_path, {"TELEGRAM_BOT_TOKEN": token, "TELEGRAM_CHAT_ID": chat_id})
 
         console.print(f"[green]✓ Updated {env_path}[/green]")
         return True
@@ -6,22 +6,26 @@ Demonstrates how the early meme coin filter works.
 """
 
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-sys.path.insert(0, str(Path(__file__).parent.parent))
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
 
 from dotenv import load_dotenv
 from rich.console import Console
+from rich.live import Live
 from rich.table import Table
 
 from journaltx.core.config import Config
 from journaltx.filters.market_cap import is_early_meme_coin, check_dexscreener
 
-load_dotenv()
 console = Console()
 
 
 def test_filter():
     """Test market cap filter on example coins."""
+    load_dotenv()
     config = Config.from_env()
 
     # Test coins
@@ -43,48 +47,65 @@ def test_filter():
     table.add_column("Pair Age", justify="right")
     table.add_column("Result", style="bold")
 
-    for pair, description in test_pairs:
-        console.print(f"\n[bold]Testing: {pair}[/bold]")
-        console.print(f"Description: {description}")
+    now_ms = int(time.time() * 1000)
+    console.print()
 
-        is_early, data = is_early_meme_coin(
-            pair,
-            max_market_cap=config.max_market_cap,
-            max_pair_age_hours=config.max_pair_age_hours
-        )
-
-        if data:
-            market_cap = data.get("market_cap", 0)
-            pair_created = data.get("pair_created_at")
-
-            if pair_created:
-                from datetime import datetime, timedelta
-                pair_age = datetime.now() - datetime.fromtimestamp(pair_created / 1000)
-                age_str = str(pair_age).split(".")[0]
+    # Each check is an independent DexScreener lookup - run them together
+    # and stream each row into the live table as soon as it completes
+    with ThreadPoolExecutor(max_workers=len(test_pairs)) as executor, \
+            Live(table, console=console, refresh_per_second=4):
+        futures = {
+            executor.submit(
+                is_early_meme_coin,
+                pair,
+                max_market_cap=config.max_market_cap,
+                max_pair_age_hours=config.max_pair_age_hours
+            ): (pair, description)
+            for pair, description in test_pairs
+        }
+
+        for future in as_completed(futures):
+            pair, description = futures[future]
+            is_early, data = future.result()
+
+            console.print(f"[bold]Testing: {pair}[/bold]")
+            console.print(f"Description: {description}\n")
+
+            if data:
+                market_cap = data.get("market_cap", 0)
+                pair_created = data.get("pair_created_at")
+
+                if pair_created:
+                    # Same "[N days, ]H:MM:SS" format as str(timedelta), in int math
+                    age_sec = (now_ms - int(pair_created)) // 1000
+                    days, rem = divmod(age_sec, 86400)
+                    hours, rem = divmod(rem, 3600)
+                    mins, secs = divmod(rem, 60)
+                    age_str = f"{hours}:{mins:02d}:{secs:02d}"
+                    if days:
+                        age_str = f"{days} day{'s' if abs(days) != 1 else ''}, {age_str}"
+                else:
+                    age_str = "Unknown"
+
+                result = "[green]✓ PASS[/green]" if is_early else "[red]✗ REJECT[/red]"
+                expected = "PASS" if "NEWCOIN" in pair else "REJECT"
+
+                table.add_row(
+                    pair,
+                    expected,
+                    f"${market_cap:,.0f}",
+                    age_str,
+                    result
+                )
             else:
-                age_str = "Unknown"
+                table.add_row(
+                    pair,
+                    "?",
+                    "N/A",
+                    "N/A",
+                    "[yellow]? UNKNOWN[/yellow]"
+                )
 
-            result = "[green]✓ PASS[/green]" if is_early else "[red]✗ REJECT[/red]"
-            expected = "PASS" if "NEWCOIN" in pair else "REJECT"
-
-            table.add_row(
-                pair,
-                expected,
-                f"${market_cap:,.0f}",
-                age_str,
-                result
-            )
-        else:
-            table.add_row(
-                pair,
-                "?",
-                "N/A",
-                "N/A",
-                "[yellow]? UNKNOWN[/yellow]"
-            )
-
-    console.print("\n")
-    console.print(table)
     console.print("\n[dim]Filter ensures only early meme coins trigger alerts[/dim]\n")
 
 
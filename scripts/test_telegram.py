@@ -8,9 +8,12 @@ Sends test alerts to verify Telegram is working.
 import sys
 from pathlib import Path
 
+ROOT = Path(__file__).resolve().parent.parent
+
 # Add parent directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(ROOT))
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from dotenv import load_dotenv
 import os
@@ -18,8 +21,6 @@ import typer
 from rich.console import Console
 
 from journaltx.core.config import Config
-from journaltx.core.models import Alert, AlertType
-from journaltx.notify.telegram import TelegramNotifier
 
 app = typer.Typer(help="Test Telegram notifications")
 console = Console()
@@ -28,6 +29,9 @@ console = Console()
 @app.command()
 def main():
     """Send test Telegram notifications."""
+    from journaltx.core.models import Alert, AlertType
+    from journaltx.notify.telegram import TelegramNotifier
+
     load_dotenv()
 
     if not os.getenv("TELEGRAM_BOT_TOKEN") or not os.getenv("TELEGRAM_CHAT_ID"):
@@ -41,7 +45,6 @@ def main():
     console.print("[yellow]Sending test alerts...[/yellow]\n")
 
     # Test 1: LP Added alert
-    console.print("Sending LP Added test...")
     lp_alert = Alert(
         type=AlertType.LP_ADD,
         chain="solana",
@@ -50,10 +53,8 @@ def main():
         value_usd=187500.0,
         triggered_at=datetime.utcnow(),
     )
-    telegram.send_alert(lp_alert)
 
     # Test 2: Volume Spike alert
-    console.print("Sending Volume Spike test...")
     volume_alert = Alert(
         type=AlertType.VOLUME_SPIKE,
         chain="solana",
@@ -62,10 +63,8 @@ def main():
         value_usd=750000.0,
         triggered_at=datetime.utcnow(),
     )
-    telegram.send_alert(volume_alert)
 
     # Test 3: LP Removed alert
-    console.print("Sending LP Removed test...")
     remove_alert = Alert(
         type=AlertType.LP_REMOVE,
         chain="solana",
@@ -74,14 +73,33 @@ def main():
         value_usd=120000.0,
         triggered_at=datetime.utcnow(),
     )
-    telegram.send_alert(remove_alert)
 
-    # Test 4: Weekly review
-    console.print("Sending weekly review test...")
+    # Test 4: Weekly review (DB work, done before sending)
     from journaltx.review.weekly import format_weekly_review
 
     review = format_weekly_review(config, days=7)
-    telegram.send_message(review)
+
+    # The four sends are independent HTTPS posts - run them concurrently
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        sends = [
+            ("LP Added", executor.submit(telegram.send_alert, lp_alert)),
+            ("Volume Spike", executor.submit(telegram.send_alert, volume_alert)),
+            ("LP Removed", executor.submit(telegram.send_alert, remove_alert)),
+            ("Weekly review", executor.submit(telegram.send_message, review)),
+        ]
+
+    # Report in submission order so the output reads the same every run
+    failed = []
+    for label, future in sends:
+        if future.result():
+            console.print(f"Sent {label} test")
+        else:
+            console.print(f"[red]Failed to send {label} test[/red]")
+            failed.append(label)
+
+    if failed:
+        console.print(f"\n[red]✗ {len(failed)} of {len(sends)} test notifications failed: {', '.join(failed)}[/red]")
+        raise typer.Exit(1)
 
     console.print("\n[green]✓ All test notifications sent![/green]")
     console.print("Check your Telegram app.")
@@ -94,6 +112,9 @@ def custom(
     alert_type: str = typer.Option("lp_add", "--type", "-t", help="Alert type (lp_add, lp_remove, volume_spike)"),
 ):
     """Send a custom test alert."""
+    from journaltx.core.models import Alert, AlertType
+    from journaltx.notify.telegram import TelegramNotifier
+
     load_dotenv()
 
     if not os.getenv("TELEGRAM_BOT_TOKEN") or not os.getenv("TELEGRAM_CHAT_ID"):
@@ -128,4 +149,12 @@ def custom(
 
 
 if __name__ == "__main__":
-    app()
+    # A bare `python scripts/test_telegram.py` (as suggested by the setup
+    # scripts) runs the default test set directly, skipping typer's parse
+    if len(sys.argv) == 1:
+        try:
+            main()
+        except typer.Exit as e:
+            sys.exit(e.exit_code)
+    else:
+        app()
@@ -6,20 +6,32 @@ is an early-stage opportunity worth alerting on.
 """
 
 import pytest
-from unittest.mock import patch, MagicMock
-import sys
-from pathlib import Path
-
-# Add parent to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
+from unittest.mock import Mock
+from types import SimpleNamespace
 
 from journaltx.filters.early_meme import check_early_stage_opportunity
+from journaltx.filters.signals import SignalTracker
+
+
+@pytest.fixture(autouse=True)
+def mock_market(monkeypatch):
+    """Stub out DexScreener market data lookups."""
+    mock = Mock()
+    monkeypatch.setattr("journaltx.filters.early_meme.get_pair_market_data", mock)
+    return mock
+
+
+@pytest.fixture(autouse=True)
+def mock_tracker(monkeypatch):
+    """Stub out the global signal tracker so tests don't share state."""
+    mock = Mock(return_value=Mock(spec=SignalTracker))
+    monkeypatch.setattr("journaltx.filters.early_meme.get_signal_tracker", mock)
+    return mock
 
 
 class TestPairTypeFiltering:
     """Test TOKEN/SOL pair filtering."""
 
-    @patch("journaltx.filters.early_meme.get_pair_market_data")
     def test_invalid_pair_format(self, mock_market):
         """Pair without / should fail."""
         should_alert, should_log, details = check_early_stage_opportunity(
@@ -30,7 +42,6 @@ class TestPairTypeFiltering:
         assert should_alert is False
         assert "FAIL" in str(details["checks"])
 
-    @patch("journaltx.filters.early_meme.get_pair_market_data")
     def test_non_sol_quote_rejected(self, mock_market):
         """Non-SOL quote pairs should fail."""
         should_alert, should_log, details = check_early_stage_opportunity(
@@ -40,7 +51,6 @@ class TestPairTypeFiltering:
         )
         assert should_alert is False
 
-    @patch("journaltx.filters.early_meme.get_pair_market_data")
     def test_sol_quote_passes(self, mock_market):
         """TOKEN/SOL pairs should pass pair type check."""
         mock_market.return_value = {
@@ -65,7 +75,6 @@ class TestPairTypeFiltering:
 class TestLegacyMemeFiltering:
     """Test legacy meme exclusion."""
 
-    @patch("journaltx.filters.early_meme.get_pair_market_data")
     def test_legacy_meme_blocked(self, mock_market):
         """Legacy memes (BONK, WIF, etc.) should be blocked."""
         mock_market.return_value = {"legacy_meme": True}
@@ -84,7 +93,6 @@ class TestLegacyMemeFiltering:
 class TestPairAgeFiltering:
     """Test pair age filtering rules."""
 
-    @patch("journaltx.filters.early_meme.get_pair_market_data")
     def test_old_pair_blocked(self, mock_market):
         """Pairs older than hard_reject_pair_age_hours should be blocked."""
         mock_market.return_value = {
@@ -103,7 +111,6 @@ class TestPairAgeFiltering:
         assert should_alert is False
         assert "BLOCK" in str(details["checks"])
 
-    @patch("journaltx.filters.early_meme.get_pair_market_data")
     def test_early_pair_high_priority(self, mock_market):
         """Pairs <30 min should be HIGH priority."""
         mock_market.return_value = {
@@ -125,7 +132,6 @@ class TestPairAgeFiltering:
 class TestMarketCapFiltering:
     """Test market cap defensive filtering."""
 
-    @patch("journaltx.filters.early_meme.get_pair_market_data")
     def test_large_cap_blocked(self, mock_market):
         """Large market cap (>$20M) should be blocked."""
         mock_market.return_value = {
@@ -143,7 +149,6 @@ class TestMarketCapFiltering:
 
         assert should_alert is False
 
-    @patch("journaltx.filters.early_meme.get_pair_market_data")
     def test_small_cap_passes(self, mock_market):
         """Small market cap (<$20M) should pass."""
         mock_market.return_value = {
@@ -167,7 +172,6 @@ class TestMarketCapFiltering:
 class TestNearZeroIgnition:
     """Test near-zero ignition filtering."""
 
-    @patch("journaltx.filters.early_meme.get_pair_market_data")
     def test_near_zero_ignition_passes(self, mock_market):
         """Near-zero baseline + significant add should pass."""
         mock_market.return_value = {
@@ -187,7 +191,6 @@ class TestNearZeroIgnition:
 
         assert details.get("ignition_pass") is True
 
-    @patch("journaltx.filters.early_meme.get_pair_market_data")
     def test_high_baseline_fails(self, mock_market):
         """High baseline liquidity should fail ignition check."""
         mock_market.return_value = {
@@ -206,7 +209,6 @@ class TestNearZeroIgnition:
         assert details.get("ignition_pass") is False
         assert should_alert is False
 
-    @patch("journaltx.filters.early_meme.get_pair_market_data")
     def test_small_addition_fails(self, mock_market):
         """Small LP addition should fail ignition check."""
         mock_market.return_value = {
@@ -229,8 +231,6 @@ class TestNearZeroIgnition:
 class TestNewPoolBypass:
     """Test new pool multi-signal bypass."""
 
-    @patch("journaltx.filters.early_meme.get_pair_market_data")
-    @patch("journaltx.filters.early_meme.get_signal_tracker")
     def test_new_pool_bypasses_multi_signal(self, mock_tracker, mock_market):
         """New pool creation should bypass multi-signal requirement."""
         mock_market.return_value = {
@@ -238,7 +238,7 @@ class TestNewPoolBypass:
             "pair_age_hours": 0.1,  # Very new
             "market_cap": 50_000,
         }
-        mock_tracker.return_value = MagicMock()
+        mock_tracker.return_value = SimpleNamespace()  # bypass never consults the tracker
 
         should_alert, should_log, details = check_early_stage_opportunity(
             pair="TOKEN/SOL",
@@ -253,8 +253,6 @@ class TestNewPoolBypass:
         if multi_check:
             assert "BYPASS" in multi_check[0]["status"]
 
-    @patch("journaltx.filters.early_meme.get_pair_market_data")
-    @patch("journaltx.filters.early_meme.get_signal_tracker")
     def test_existing_pool_needs_multi_signal(self, mock_tracker, mock_market):
         """Existing pool additions should require multi-signal."""
         mock_market.return_value = {
@@ -263,11 +261,11 @@ class TestNewPoolBypass:
             "market_cap": 5_000_000,
         }
 
-        # Mock signal tracker to return no alert (not enough signals)
-        mock_tracker_instance = MagicMock()
-        mock_tracker_instance.add_signal.return_value = False
-        mock_tracker_instance.get_signal_count.return_value = {"total": 1, "types": {"lp_add": 1}}
-        mock_tracker.return_value = mock_tracker_instance
+        # Stub signal tracker to return no alert (not enough signals)
+        mock_tracker.return_value = SimpleNamespace(
+            add_signal=lambda signal: False,
+            get_signal_count=lambda pair: {"total": 1, "types": {"lp_add": 1}},
+        )
 
         should_alert, should_log, details = check_early_stage_opportunity(
             pair="TOKEN/SOL",
@@ -284,7 +282,6 @@ class TestNewPoolBypass:
 class TestShouldLog:
     """Test that events are always logged."""
 
-    @patch("journaltx.filters.early_meme.get_pair_market_data")
     def test_always_logs(self, mock_market):
         """All events should be logged (should_log=True)."""
         mock_market.return_value = {"legacy_meme": True}
@@ -301,8 +298,6 @@ class TestShouldLog:
 class TestIntegration:
     """Integration tests for full filtering flow."""
 
-    @patch("journaltx.filters.early_meme.get_pair_market_data")
-    @patch("journaltx.filters.early_meme.get_signal_tracker")
     def test_perfect_early_stage_opportunity(self, mock_tracker, mock_market):
         """Test a perfect early-stage opportunity scenario."""
         mock_market.return_value = {
@@ -311,7 +306,7 @@ class TestIntegration:
             "market_cap": 100_000,  # $100K
             "liquidity_usd": 15_000,
         }
-        mock_tracker.return_value = MagicMock()
+        mock_tracker.return_value = SimpleNamespace()  # bypass never consults the tracker
 
         should_alert, should_log, details = check_early_stage_opportunity(
             pair="NEWMEME/SOL",
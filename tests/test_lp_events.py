@@ -0,0 +1,74 @@
+"""
+Unit tests for LP event alert persistence.
+
+Tests that alerts returned by the listener stay readable after the
+session that stored them has committed and closed.
+"""
+
+from datetime import datetime
+
+import pytest
+
+from journaltx.core.config import Config
+from journaltx.core.db import init_db
+from journaltx.ingest.quicknode import lp_events
+from journaltx.ingest.quicknode.lp_events import LPEventListener
+from journaltx.ingest.quicknode.transaction_parser import ParsedLPEvent
+
+
+@pytest.fixture
+def listener(tmp_path, monkeypatch):
+    """Listener backed by a throwaway SQLite database, filter stubbed to pass."""
+    monkeypatch.setattr(
+        lp_events,
+        "check_early_stage_opportunity",
+        lambda **kwargs: (True, True, {"checks": []}),
+    )
+    config = Config(database_path=str(tmp_path / "journaltx.db"))
+    init_db(config)
+    return LPEventListener(config)
+
+
+def _parsed_event() -> ParsedLPEvent:
+    """Build a parsed LP event well above the default thresholds."""
+    return ParsedLPEvent(
+        signature="sig1",
+        slot=1,
+        pool_address="pool1",
+        is_new_pool=True,
+        token_mint="mint1",
+        token_symbol="NEW",
+        token_name="New Token",
+        sol_amount=10_000.0,
+        sol_amount_usd=2_000_000.0,
+        token_amount=1_000_000.0,
+        liquidity_usd=2_000_000.0,
+        liquidity_sol=10_000.0,
+        market_cap=100_000.0,
+        pair_age_hours=0.1,
+        price_usd=0.001,
+        pair_string="NEW/SOL",
+        dexscreener_url="",
+        timestamp=datetime.utcnow(),
+    )
+
+
+class TestAlertDetachment:
+    """Alerts must be usable after session_scope has committed."""
+
+    def test_parsed_event_alert_readable_after_commit(self, listener):
+        """Returned alert reads without DetachedInstanceError."""
+        alert = listener.process_parsed_lp_event(_parsed_event())
+
+        assert alert.id is not None
+        assert alert.early_stage_passed is True
+        assert alert.pair == "NEW/SOL"
+
+    def test_on_alert_callback_can_defer_reads(self, listener):
+        """Callbacks may keep the alert and read it after the session closes."""
+        received = []
+
+        listener.process_parsed_lp_event(_parsed_event(), on_alert=received.append)
+
+        assert received[0].early_stage_passed is True
+        assert received[0].value_sol == 10_000.0
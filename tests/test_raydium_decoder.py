@@ -8,12 +8,12 @@ Tests the core on-chain LP detection logic:
 """
 
 import pytest
-from unittest.mock import patch, MagicMock
-import sys
-from pathlib import Path
+import base58
 
-# Add parent to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
+try:
+    from orjson import dumps as json_dumps, loads as json_loads
+except ImportError:  # optional speedup, stdlib json is the fallback
+    from json import dumps as json_dumps, loads as json_loads
 
 from journaltx.ingest.quicknode.raydium_decoder import (
     decode_raydium_transaction,
@@ -24,48 +24,65 @@ from journaltx.ingest.quicknode.raydium_decoder import (
     LPAdditionInfo,
     RAYDIUM_AMM_V4,
     MIN_SOL_DELTA_LAMPORTS,
+    MIN_SOL_DELTA_SOL,
     WSOL_MINT,
 )
 
+# Encoded instruction data, built once per module rather than per test:
+# discriminator + padding, and discriminator-only variants
+_DISC_B58 = {n: base58.b58encode(bytes([n, 1, 2, 3])).decode() for n in (0, 1, 3, 4, 9)}
+_DISC1_B58 = {n: base58.b58encode(bytes([n])).decode() for n in (0, 3, 9)}
+
+
+@pytest.fixture(scope="session")
+def raydium_tx_blob():
+    """Canonical single-instruction Raydium transaction, serialized once."""
+    return json_dumps({
+        "meta": {
+            "err": None,
+            "preBalances": [],
+            "postBalances": [],
+            "preTokenBalances": [],
+            "postTokenBalances": [],
+            "innerInstructions": [],
+        },
+        "transaction": {
+            "signatures": ["test_signature_123456789"],
+            "message": {
+                "accountKeys": [
+                    "user_wallet",
+                    "pool_vault",
+                    RAYDIUM_AMM_V4,
+                ],
+                "instructions": [{
+                    "programId": RAYDIUM_AMM_V4,
+                    "data": "",
+                    "accounts": [0, 1],
+                }],
+            },
+        },
+    })
+
+
+@pytest.fixture
+def raydium_tx(raydium_tx_blob):
+    """Fresh mutable copy of the canonical transaction for one test."""
+    return json_loads(raydium_tx_blob)
+
 
 class TestInstructionDecoding:
     """Test Raydium instruction type decoding."""
 
-    def test_decode_initialize_instruction(self):
-        """Discriminator 0 = initialize (pool creation)."""
-        import base58
-        # Create data with discriminator 0
-        data = base58.b58encode(bytes([0, 1, 2, 3])).decode()
-        result = _decode_instruction_type(data)
-        assert result == "initialize"
-
-    def test_decode_initialize2_instruction(self):
-        """Discriminator 1 = initialize2 (pool creation)."""
-        import base58
-        data = base58.b58encode(bytes([1, 1, 2, 3])).decode()
-        result = _decode_instruction_type(data)
-        assert result == "initialize2"
-
-    def test_decode_deposit_instruction(self):
-        """Discriminator 3 = deposit (add liquidity)."""
-        import base58
-        data = base58.b58encode(bytes([3, 1, 2, 3])).decode()
-        result = _decode_instruction_type(data)
-        assert result == "deposit"
-
-    def test_decode_withdraw_instruction(self):
-        """Discriminator 4 = withdraw (remove liquidity)."""
-        import base58
-        data = base58.b58encode(bytes([4, 1, 2, 3])).decode()
-        result = _decode_instruction_type(data)
-        assert result == "withdraw"
-
-    def test_decode_swap_instruction(self):
-        """Discriminator 9 = swap (not LP)."""
-        import base58
-        data = base58.b58encode(bytes([9, 1, 2, 3])).decode()
-        result = _decode_instruction_type(data)
-        assert result == "swap"
+    @pytest.mark.parametrize("disc,expected", [
+        (0, "initialize"),   # pool creation
+        (1, "initialize2"),  # pool creation
+        (3, "deposit"),      # add liquidity
+        (4, "withdraw"),     # remove liquidity
+        (9, "swap"),         # not LP
+    ])
+    def test_decode_discriminator(self, disc, expected):
+        """Leading discriminator byte maps to its instruction type."""
+        assert _decode_instruction_type(_DISC_B58[disc]) == expected
 
     def test_decode_empty_data(self):
         """Empty data should return unknown."""
@@ -119,9 +136,6 @@ class TestBalanceDeltas:
 
     def test_noise_threshold(self):
         """Small SOL changes below threshold should be filtered."""
-        # MIN_SOL_DELTA_LAMPORTS = 100_000_000 = 0.1 SOL
-        min_sol = MIN_SOL_DELTA_LAMPORTS / 1_000_000_000
-
         meta = {
             "preBalances": [1_000_000_000, 500_000_000_000],
             "postBalances": [900_000_000, 500_050_000_000],  # Only 0.05 SOL increase
@@ -136,7 +150,7 @@ class TestBalanceDeltas:
         # Result exists but delta is small
         assert result is not None
         assert result["sol_delta"] == 0.05
-        assert result["sol_delta"] < min_sol  # Below threshold
+        assert result["sol_delta"] < MIN_SOL_DELTA_SOL  # Below threshold (0.1 SOL)
 
 
 class TestAccountKeys:
@@ -177,10 +191,9 @@ class TestFindRaydiumInstruction:
 
     def test_find_in_main_instructions(self):
         """Should find Raydium instruction in main instructions."""
-        import base58
         instructions = [
             {"programId": "TokenkegQfeZyiNwAJbNbGKPFXCWuBvf9Ss623VQ5DA", "data": ""},
-            {"programId": RAYDIUM_AMM_V4, "data": base58.b58encode(bytes([3])).decode()},
+            {"programId": RAYDIUM_AMM_V4, "data": _DISC1_B58[3]},
         ]
         meta = {"innerInstructions": []}
 
@@ -192,14 +205,13 @@ class TestFindRaydiumInstruction:
 
     def test_find_in_inner_instructions(self):
         """Should find Raydium instruction in inner (CPI) instructions."""
-        import base58
         instructions = [
             {"programId": "TokenkegQfeZyiNwAJbNbGKPFXCWuBvf9Ss623VQ5DA", "data": ""},
         ]
         meta = {
             "innerInstructions": [{
                 "instructions": [
-                    {"programId": RAYDIUM_AMM_V4, "data": base58.b58encode(bytes([0])).decode()},
+                    {"programId": RAYDIUM_AMM_V4, "data": _DISC1_B58[0]},
                 ]
             }]
         }
@@ -239,36 +251,13 @@ class TestFullDecoding:
 
         assert result is None
 
-    def test_successful_lp_add(self):
+    def test_successful_lp_add(self, raydium_tx):
         """Test successful LP addition detection."""
-        import base58
-
         # Simulate a deposit transaction with balance increases
-        transaction = {
-            "meta": {
-                "err": None,
-                "preBalances": [1_000_000_000_000, 100_000_000_000],  # 1000 SOL, 100 SOL
-                "postBalances": [900_000_000_000, 200_000_000_000],  # 900 SOL, 200 SOL (100 SOL added)
-                "preTokenBalances": [],
-                "postTokenBalances": [],
-                "innerInstructions": [],
-            },
-            "transaction": {
-                "signatures": ["test_signature_123456789"],
-                "message": {
-                    "accountKeys": [
-                        "user_wallet",
-                        "pool_vault",
-                        RAYDIUM_AMM_V4,
-                    ],
-                    "instructions": [{
-                        "programId": RAYDIUM_AMM_V4,
-                        "data": base58.b58encode(bytes([3])).decode(),  # deposit
-                        "accounts": [0, 1],
-                    }],
-                },
-            },
-        }
+        transaction = raydium_tx
+        transaction["meta"]["preBalances"] = [1_000_000_000_000, 100_000_000_000]  # 1000 SOL, 100 SOL
+        transaction["meta"]["postBalances"] = [900_000_000_000, 200_000_000_000]  # 900 SOL, 200 SOL (100 SOL added)
+        transaction["transaction"]["message"]["instructions"][0]["data"] = _DISC1_B58[3]  # deposit
 
         result = decode_raydium_transaction(transaction, "http://test")
 
@@ -277,31 +266,12 @@ class TestFullDecoding:
         assert result.quote_amount_sol == 100.0  # 100 SOL delta
         assert result.is_pool_creation is False  # deposit, not initialize
 
-    def test_swap_rejected(self):
+    def test_swap_rejected(self, raydium_tx):
         """Swap transactions should not be detected as LP adds."""
-        import base58
-
-        transaction = {
-            "meta": {
-                "err": None,
-                "preBalances": [1_000_000_000_000, 100_000_000_000],
-                "postBalances": [1_100_000_000_000, 50_000_000_000],  # User gained, pool lost
-                "preTokenBalances": [],
-                "postTokenBalances": [],
-                "innerInstructions": [],
-            },
-            "transaction": {
-                "signatures": ["test_sig"],
-                "message": {
-                    "accountKeys": ["user", "pool", RAYDIUM_AMM_V4],
-                    "instructions": [{
-                        "programId": RAYDIUM_AMM_V4,
-                        "data": base58.b58encode(bytes([9])).decode(),  # swap
-                        "accounts": [0, 1],
-                    }],
-                },
-            },
-        }
+        transaction = raydium_tx
+        transaction["meta"]["preBalances"] = [1_000_000_000_000, 100_000_000_000]
+        transaction["meta"]["postBalances"] = [1_100_000_000_000, 50_000_000_000]  # User gained, pool lost
+        transaction["transaction"]["message"]["instructions"][0]["data"] = _DISC1_B58[9]  # swap
 
         result = decode_raydium_transaction(transaction, "http://test")
 
@@ -311,18 +281,16 @@ class TestFullDecoding:
 class TestConstants:
     """Test constant values."""
 
-    def test_raydium_program_id(self):
-        """Verify Raydium AMM V4 program ID."""
-        # This should NOT change - it's the canonical Raydium program
-        assert RAYDIUM_AMM_V4 == "675kPX9MHTjS2zt1qfr1NYHuzeLXfQM9H24wFSUt1Mp8"
-
-    def test_wsol_mint(self):
-        """Verify WSOL mint address."""
-        assert WSOL_MINT == "So11111111111111111111111111111111111111112"
-
-    def test_noise_threshold(self):
-        """Verify noise threshold is 0.1 SOL."""
-        assert MIN_SOL_DELTA_LAMPORTS == 100_000_000  # 0.1 SOL in lamports
+    @pytest.mark.parametrize("value,expected", [
+        # Canonical Raydium program - this should NOT change
+        (RAYDIUM_AMM_V4, "675kPX9MHTjS2zt1qfr1NYHuzeLXfQM9H24wFSUt1Mp8"),
+        (WSOL_MINT, "So11111111111111111111111111111111111111112"),
+        (MIN_SOL_DELTA_LAMPORTS, 100_000_000),  # 0.1 SOL in lamports
+        (MIN_SOL_DELTA_SOL, 0.1),
+    ], ids=["raydium_program_id", "wsol_mint", "noise_threshold", "noise_threshold_sol"])
+    def test_constant(self, value, expected):
+        """Verify canonical program IDs and the noise threshold."""
+        assert value == expected
 
 
 if __name__ == "__main__":
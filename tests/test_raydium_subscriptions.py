@@ -0,0 +1,77 @@
+"""
+Unit tests for logsNotification frame handling.
+
+Tests the pure helpers the WebSocket listener runs on every frame:
+- Notification parsing (signature + logs)
+- LP keyword detection
+"""
+
+from journaltx.ingest.quicknode.raydium_subscriptions import (
+    is_liquidity_addition,
+    parse_log_notification,
+)
+
+
+def _notification(value: dict) -> dict:
+    """Build a QuickNode-style logsNotification frame."""
+    return {
+        "jsonrpc": "2.0",
+        "method": "logsNotification",
+        "params": {
+            "result": {"context": {"slot": 123}, "value": value},
+            "subscription": 1,
+        },
+    }
+
+
+class TestParseLogNotification:
+    """Test signature/log extraction from notification frames."""
+
+    def test_returns_signature_and_logs(self):
+        """Successful transaction yields (signature, logs)."""
+        frame = _notification({"signature": "sig1", "err": None, "logs": ["Program log: initialize2"]})
+        assert parse_log_notification(frame) == ("sig1", ["Program log: initialize2"])
+
+    def test_ignores_failed_transaction(self):
+        """Transactions with err set are skipped."""
+        frame = _notification({"signature": "sig1", "err": {"InstructionError": []}, "logs": ["x"]})
+        assert parse_log_notification(frame) is None
+
+    def test_ignores_empty_logs(self):
+        """Notifications without logs are skipped."""
+        frame = _notification({"signature": "sig1", "err": None, "logs": []})
+        assert parse_log_notification(frame) is None
+
+    def test_ignores_missing_signature(self):
+        """Notifications without any signature are skipped."""
+        frame = _notification({"err": None, "logs": ["x"]})
+        assert parse_log_notification(frame) is None
+
+    def test_signature_directly_in_result(self):
+        """Falls back to a signature on result when there is no value."""
+        frame = {"params": {"result": {"signature": "sig2", "err": None, "logs": ["x"]}}}
+        assert parse_log_notification(frame) == ("sig2", ["x"])
+
+    def test_non_notification_frames(self):
+        """Subscription acks and unrelated frames are not notifications."""
+        assert parse_log_notification({"jsonrpc": "2.0", "result": 5, "id": 1}) is None
+        assert parse_log_notification({"params": {}}) is None
+
+
+class TestIsLiquidityAddition:
+    """Test LP keyword detection on transaction logs."""
+
+    def test_deposit_is_addition(self):
+        assert is_liquidity_addition(["Program log: Deposit"])
+
+    def test_initialize_is_addition(self):
+        assert is_liquidity_addition(["Program log: initialize2: InitializeInstruction2"])
+
+    def test_swap_is_excluded(self):
+        assert not is_liquidity_addition(["Program log: initialize", "Program log: swap"])
+
+    def test_no_keywords(self):
+        assert not is_liquidity_addition(["Program log: ray_log: AAAA"])
+
+    def test_empty_logs(self):
+        assert not is_liquidity_addition([])